@@ -0,0 +1,33 @@
+#
+# Copyright 2022 dratio.io. All rights reserved.
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+#
+# The use of the services offered by this client must be in accordance with
+# dratio's terms and conditions. You may obtain a copy of the terms at
+#
+#     https://dratio.io/legal/terms/
+#
+"""
+Compatibility with older versions of Python.
+"""
+import sys
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:  # Python 3.7
+    from typing_extensions import Literal
+
+__all__ = ["Literal"]
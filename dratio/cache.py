@@ -0,0 +1,168 @@
+#
+# Copyright 2022 dratio.io. All rights reserved.
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+#
+# The use of the services offered by this client must be in accordance with
+# dratio's terms and conditions. You may obtain a copy of the terms at
+#
+#     https://dratio.io/legal/terms/
+#
+"""
+Persistent cache of the metadata of the objects of the database.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Optional, Tuple
+from urllib.parse import quote
+
+from .utils import get_version
+
+__all__ = ["MetadataCache", "default_cache_dir"]
+
+# Seconds after which a cached entry is considered stale
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def default_cache_dir() -> str:
+    """Returns the default directory of the persistent cache, which can be set
+    with the environment variable DRATIO_CACHE_DIR (defaults to
+    `~/.cache/dratio`)."""
+    path = os.environ.get("DRATIO_CACHE_DIR")
+    if path is None:
+        path = os.path.join(os.path.expanduser("~"), ".cache", "dratio")
+
+    return path
+
+
+class MetadataCache:
+    """
+    Metadata of objects stored in disk as json files, so that it is available
+    across sessions.
+
+    Entries are kept in a directory per version of the package (the format of
+    the metadata may change between versions) and per kind of object.
+    Entries older than `ttl` are still returned but flagged as stale, so the
+    caller can use them while requesting a fresh copy
+    (stale-while-revalidate).
+
+    Parameters
+    ----------
+    path : str, optional
+        Directory of the cache. Defaults to `default_cache_dir()`.
+    ttl : float, optional
+        Seconds after which an entry is considered stale. Defaults to one day.
+
+    Notes
+    -----
+    Errors reading or writing the cache are ignored: the cache only avoids
+    requests and never makes them fail.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        if path is None:
+            path = default_cache_dir()
+
+        self.path = os.path.join(path, get_version())
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        return f"MetadataCache('{self.path}')"
+
+    def _entry_path(self, kind: str, code: str) -> str:
+        """Returns the path of the file of an entry."""
+        return os.path.join(
+            self.path, quote(kind.strip("/"), safe=""), quote(code, safe="") + ".json"
+        )
+
+    def get(self, kind: str, code: str) -> Optional[Tuple[Any, bool]]:
+        """Returns the metadata of an object and whether it is stale, or None if
+        it is not cached.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of object (e.g. the url of its class).
+        code : str
+            Code of the object.
+
+        Returns
+        -------
+        Optional[Tuple[Any, bool]]
+            Metadata of the object and whether it is older than `ttl`.
+        """
+        path = self._entry_path(kind, code)
+        try:
+            age = time.time() - os.path.getmtime(path)
+            with open(path, encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return metadata, age > self.ttl
+
+    def set(self, kind: str, code: str, metadata: Any) -> None:
+        """Stores the metadata of an object.
+
+        The file is written to a temporary file and then moved, so concurrent
+        readers (e.g. other processes) never read a partial entry.
+        """
+        path = self._entry_path(kind, code)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(metadata, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def delete(self, code: Optional[str] = None, kind: Optional[str] = None) -> None:
+        """Removes the entry of the object with the given code and kind, the
+        entries with the given code (of any kind) if only `code` is given, all
+        the entries of a kind if only `kind` is given, or all the entries if
+        neither is given."""
+        if code is not None and kind is not None:
+            try:
+                os.remove(self._entry_path(kind, code))
+            except OSError:
+                pass
+            return
+
+        if code is None:
+            path = self.path
+            if kind is not None:
+                path = os.path.dirname(self._entry_path(kind, ""))
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        try:
+            kinds = os.listdir(self.path)
+        except OSError:
+            return
+
+        filename = quote(code, safe="") + ".json"
+        for kind in kinds:
+            try:
+                os.remove(os.path.join(self.path, kind, filename))
+            except OSError:
+                pass
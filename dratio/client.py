@@ -24,19 +24,32 @@
 Client to interact with dratio.io API
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
-
-try:  # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
+import hashlib
+import json
 import re
+import threading
+import weakref
 import warnings
 import os
+from collections import OrderedDict
 
 import requests
-from requests.compat import urljoin
+from requests.compat import urljoin, urlparse
+
+from ._compat import Literal
+from .cache import MetadataCache, default_cache_dir
 
 from .models import (
     Category,
@@ -52,8 +65,10 @@ from .models import (
     Unit,
     Version,
 )
+from .models.base import NOT_FOUND_STATUS
 from .utils import (
     _get_params_from_kwargs,
+    _map_concurrently,
     _raise_client_exception,
     _warn_param_used,
     get_version,
@@ -67,6 +82,9 @@ if TYPE_CHECKING:
 
 __all__ = ["Client"]
 
+# Kind of the entries of the persistent cache that store list responses
+_LIST_CACHE_KIND = "list"
+
 CLASSES_MAPPING = {
     "dataset": Dataset,
     "feature": Feature,
@@ -119,6 +137,37 @@ class Client:
         to the API. This is useful to reuse the same connection for multiple
         requests using a connection pool (for advanced use cases). 
         If False, a new session is created for each request. Defaults to False.
+    fetch_cache_size: int, optional
+        Maximum number of objects whose metadata is kept in memory after being
+        fetched, so that fetching again the same object (e.g. another instance
+        with the same code) does not perform a new request. The least recently
+        used entries are discarded first. Objects saved or deleted through the
+        client are removed from the cache; use `invalidate` to discard changes
+        made by other means. Defaults to 0 (disabled).
+    object_cache_size: int, optional
+        Maximum number of objects returned by `get` (and `get_dataset`,
+        `get_publisher`, ...) that are kept by the client, so that successive
+        calls with the same kind and code return the same object instead of a
+        new one. The objects are shared: changes made to one of them (e.g.
+        unsaved edits or `Dataset.set_version`) are seen by every caller. The
+        least recently used objects are discarded first, although they are
+        still returned while referenced elsewhere. Defaults to 0 (disabled,
+        each call returns a new object). Related objects (e.g. `File.version`
+        or `Version.dataset`) are kept by each object in any case, so
+        repeated accesses do not create them again.
+    persistent_cache: Union[bool, str], optional
+        If True, the metadata and the lists of reference objects that rarely
+        change (e.g. categories, scopes or units) are also stored in disk, in
+        the directory given by the environment variable DRATIO_CACHE_DIR
+        (`~/.cache/dratio` by default), and reused across sessions. A path
+        can be passed to use another directory. Entries older than one day are
+        used while they are requested again in the background. Defaults to
+        False (disabled).
+    http_cache: bool, optional
+        If True, the responses of the API are cached in disk honoring their
+        HTTP caching headers (e.g. ETag), so that unchanged resources are not
+        transferred again. Implies `use_persistent_session`. Requires the
+        cachecontrol library (`pip install dratio[cache]`). Defaults to False.
 
     Examples
     --------
@@ -159,13 +208,39 @@ class Client:
         env_name: str = "DRATIO_KEY",
         base_url: Optional[str] = None,
         use_persistent_session: bool = False,
+        fetch_cache_size: int = 0,
+        object_cache_size: int = 0,
+        persistent_cache: Union[bool, str] = False,
+        http_cache: bool = False,
     ) -> "Client":
         """Initializes the Client object"""
         self._base_url = base_url or Client.BASE_URL
-        self.persistent_session = use_persistent_session
+        self.persistent_session = use_persistent_session or http_cache
+        self.http_cache = http_cache
         self._current_session = None
         self.key = self._check_key(key, env_name)
         self._compatibility_checked = False
+        self._fetch_cache_size = fetch_cache_size
+        self._fetch_cache = OrderedDict()
+        self._fetch_cache_lock = threading.Lock()
+        self._object_cache_size = object_cache_size
+        self._object_cache = OrderedDict()
+        # Objects evicted are still reused while referenced elsewhere
+        self._object_refs = weakref.WeakValueDictionary()
+        self._object_cache_lock = threading.Lock()
+        self._persistent_cache = None
+        self._revalidating = set()
+        if persistent_cache:
+            if not isinstance(persistent_cache, str):
+                persistent_cache = default_cache_dir()
+            # Entries of different deployments are kept apart
+            self._persistent_cache = MetadataCache(
+                os.path.join(persistent_cache, urlparse(self._base_url).netloc)
+            )
+
+        if http_cache:
+            # Created now to fail early if cachecontrol is not installed
+            self._current_session = self._session
 
     def __repr__(self) -> str:
         """Represents Client object as a string"""
@@ -244,7 +319,10 @@ class Client:
         """
         if self._current_session is None:
             session = requests.Session()
-            session.headers = self._get_request_headers()
+            # Keep the default headers of requests (e.g. Accept-Encoding)
+            session.headers.update(self._get_request_headers())
+            if self.http_cache:
+                session = self._cache_session(session)
             if self.persistent_session:
                 self._current_session = session
         else:
@@ -252,6 +330,189 @@ class Client:
 
         return session
 
+    def _cache_session(self, session: requests.Session) -> requests.Session:
+        """Wraps a session to cache the responses of the API in disk. Each API
+        key has its own cache, since responses depend on the plan of the user.
+        """
+        try:
+            from cachecontrol import CacheControl
+            from cachecontrol.caches import FileCache
+
+        except ImportError:
+            raise ImportError(
+                "cachecontrol is required to cache the responses of the API. "
+                "You can install it using `pip install dratio[cache]` or directly "
+                "using `pip install cachecontrol[filecache]`."
+            )
+
+        key_hash = hashlib.sha256(self.key.encode()).hexdigest()[:16]
+        path = os.path.join(default_cache_dir(), "http", key_hash)
+
+        return CacheControl(session, cache=FileCache(path))
+
+    def _get_cached_metadata(
+        self, url: str, code: str, persistent: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached metadata of an object (identified by
+        the url of its class and its code), or None if it is not cached.
+
+        If `persistent` is True, the persistent cache (if enabled) is checked
+        as well, and stale entries are requested again in the background.
+        """
+        with self._fetch_cache_lock:
+            metadata = self._fetch_cache.get((url, code))
+            if metadata is not None:
+                self._fetch_cache.move_to_end((url, code))
+                return metadata.copy()
+
+        if not persistent or self._persistent_cache is None:
+            return None
+
+        entry = self._persistent_cache.get(url, code)
+        if entry is None:
+            return None
+
+        metadata, stale = entry
+        if stale:
+            self._revalidate(url, code)
+
+        return metadata
+
+    def _revalidate(self, url: str, code: str) -> None:
+        """Requests again the metadata of an object in a background thread and
+        updates the persistent cache with it."""
+
+        def refresh():
+            response = self._perform_request(
+                f"{url}/{code}/", allowed_status=[NOT_FOUND_STATUS]
+            )
+            if response.status_code == NOT_FOUND_STATUS:
+                # Only the entry revalidated: other kinds may share the code
+                self._persistent_cache.delete(code, kind=url)
+            else:
+                self._persistent_cache.set(url, code, response.json())
+
+        self._refresh_in_background((url, code), refresh)
+
+    def _refresh_in_background(self, key: Any, refresh: Callable[[], None]) -> None:
+        """Runs `refresh` in a background thread, unless a refresh of the same
+        entry of the persistent cache is already running."""
+        with self._fetch_cache_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def run():
+            try:
+                refresh()
+            except Exception:
+                # The stale entry is kept and requested again the next time
+                pass
+            finally:
+                with self._fetch_cache_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _get_list(
+        self, url: str, params: Dict[str, Any], persistent: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Performs a list request.
+
+        If `persistent` is True and the persistent cache is enabled, the
+        response is stored in it and reused (stale entries are requested again
+        in the background). Entries depend on the API key, since lists only
+        include the objects visible to the user.
+        """
+        if not persistent or self._persistent_cache is None:
+            return self._perform_request(url, params=params).json()
+
+        request = json.dumps([self.key, url, sorted(params.items())], default=str)
+        code = hashlib.sha256(request.encode()).hexdigest()
+
+        def refresh():
+            data = self._perform_request(url, params=params).json()
+            self._persistent_cache.set(_LIST_CACHE_KIND, code, data)
+            return data
+
+        entry = self._persistent_cache.get(_LIST_CACHE_KIND, code)
+        if entry is None:
+            return refresh()
+
+        data, stale = entry
+        if stale:
+            self._refresh_in_background((_LIST_CACHE_KIND, code), refresh)
+
+        return data
+
+    def _cache_metadata(
+        self, url: str, code: str, metadata: Dict[str, Any], persistent: bool = False
+    ) -> None:
+        """Stores a copy of the metadata of an object in the fetch cache,
+        discarding the least recently used entries if the cache is full.
+
+        If `persistent` is True, the metadata is also stored in the persistent
+        cache (if enabled).
+        """
+        if persistent and self._persistent_cache is not None:
+            self._persistent_cache.set(url, code, metadata)
+
+        if self._fetch_cache_size <= 0:
+            return
+
+        with self._fetch_cache_lock:
+            self._fetch_cache[(url, code)] = metadata.copy()
+            self._fetch_cache.move_to_end((url, code))
+
+            while len(self._fetch_cache) > self._fetch_cache_size:
+                self._fetch_cache.popitem(last=False)
+
+    def invalidate(self, code: Optional[str] = None) -> None:
+        """Discards the cached metadata of the objects with the given code, so
+        they are requested again to the API the next time they are fetched.
+
+        Parameters
+        ----------
+        code : str, optional
+            Code of the objects to discard. If None, the whole cache is
+            cleared. Defaults to None.
+
+        Examples
+        --------
+
+        >>> client = Client('Your API key', fetch_cache_size=1024)
+        >>> client.invalidate('municipalities')
+        """
+        if self._persistent_cache is not None:
+            self._persistent_cache.delete(code)
+            # Any change may alter the lists
+            self._persistent_cache.delete(kind=_LIST_CACHE_KIND)
+
+        with self._object_cache_lock:
+            if code is None:
+                self._object_cache.clear()
+                self._object_refs.clear()
+            else:
+                for key in [k for k in self._object_cache if k[1] == code]:
+                    del self._object_cache[key]
+                for key in [k for k in list(self._object_refs) if k[1] == code]:
+                    self._object_refs.pop(key, None)
+
+        with self._fetch_cache_lock:
+            if code is None:
+                self._fetch_cache.clear()
+                return
+
+            for key in [k for k in self._fetch_cache if k[1] == code]:
+                del self._fetch_cache[key]
+
+    def clear_cache(self) -> None:
+        """Discards all the objects and metadata cached by the client.
+
+        Equivalent to `invalidate()` without a code.
+        """
+        self.invalidate()
+
     def _perform_request(
         self,
         url: str,
@@ -393,19 +654,55 @@ class Client:
         ValueError
             If kind is not 'dataset', 'feature' or 'publisher'.
 
+        Notes
+        -----
+        If the client was created with an `object_cache_size`, objects are
+        cached by kind and code, so successive calls with the same code return
+        the same object (and its metadata is only fetched once). Use
+        `invalidate` or `clear_cache` to discard them.
+
         """
         # Relax the type of code to allow None for internal use
         if code is None:
             return None
 
+        key = (kind, code)
+        cached = self._object_cache_size > 0 and version is None
+        if cached:
+            with self._object_cache_lock:
+                obj = self._object_cache.get(key)
+                if obj is None:
+                    obj = self._object_refs.get(key)
+                if obj is not None:
+                    self._cache_object(key, obj)
+                    return obj
+
         resource_cls = Client._resolve_class(kind)
 
         if kind == "dataset":
-            return resource_cls(client=self, code=code, version=version)
+            obj = resource_cls(client=self, code=code, version=version)
+        else:
+            _warn_param_used(version, "version")
+            obj = resource_cls(client=self, code=code)
 
-        _warn_param_used(version, "version")
+        if cached:
+            with self._object_cache_lock:
+                # Another thread could have cached the same object meanwhile
+                obj = self._object_refs.setdefault(key, obj)
+                self._cache_object(key, obj)
 
-        return resource_cls(client=self, code=code)
+        return obj
+
+    def _cache_object(self, key: tuple, obj: Any):
+        """Keeps an object in the cache of `get` as the most recently used,
+        evicting the least recently used ones. Must be called holding
+        `_object_cache_lock`."""
+        self._object_cache[key] = obj
+        self._object_cache.move_to_end(key)
+        self._object_refs[key] = obj
+
+        while len(self._object_cache) > self._object_cache_size:
+            self._object_cache.popitem(last=False)
 
     def get_dataset(self, code: str, version: str = None) -> Dataset:
         """Returns a Dataset object with the information associated with the
@@ -464,6 +761,12 @@ class Client:
             Dataset object with the information associated with the
             dataset through which the information can be downloaded.
 
+        Notes
+        -----
+        If the client was created with an `object_cache_size`, features are
+        cached by code, so successive calls with the same code return the same
+        object (and its metadata is only fetched once).
+
         """
         return self.get(code=code, kind="feature")
 
@@ -487,6 +790,53 @@ class Client:
         """
         return self.get(code=code, kind="file")
 
+    def prefetch(
+        self,
+        codes: Iterable[str],
+        kind: DatabaseResourceLiteral = "dataset",
+    ) -> List["DatabaseResource"]:
+        """Fetches the metadata of several objects of the same kind concurrently.
+
+        If the client was created with an `object_cache_size` (or a
+        `fetch_cache_size`), the objects (or their metadata) are kept by the
+        client, so that later accesses to them (e.g. `feature.publisher` for a
+        list of features) do not perform a request each.
+
+        Parameters
+        ----------
+        codes : Iterable[str]
+            Codes of the objects to fetch. Repeated codes and None values are
+            ignored.
+        kind : Literal["dataset", "feature", "publisher", ...], optional
+            Kind of the objects. Defaults to "dataset".
+
+        Returns
+        -------
+        List[DatabaseResource]
+            Fetched objects, in the order of their first appearance in
+            `codes`. Objects not found in the database are included with
+            their metadata empty.
+
+        Examples
+        --------
+
+        >>> client = Client('Your API key', object_cache_size=1024)
+        >>> dataset = client.get("municipalities")
+        >>> features = client.prefetch(dataset["feature_set"], kind="feature")
+        >>> publishers = client.prefetch(
+        ...     [f["publisher"] for f in features], kind="publisher"
+        ... )
+        """
+        unique_codes = [c for c in dict.fromkeys(codes) if c is not None]
+        objects = [self.get(code=c, kind=kind) for c in unique_codes]
+
+        _map_concurrently(
+            lambda obj: obj.fetch(fail_not_found=False),
+            [obj for obj in objects if not obj._fetched],
+        )
+
+        return objects
+
     def list(
         self,
         kind: DatabaseResourceLiteral = "dataset",
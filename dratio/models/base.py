@@ -24,27 +24,63 @@
 """
 Base class for database objects.
 """
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from .._compat import Literal
 from ..exceptions import ObjectNotFound
 from ..utils import _format_list_response
 
-try:  # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
-
 if TYPE_CHECKING:
     import pandas as pd
 
     from ..client import Client
 
-__all__ = ["DatabaseResource"]
+__all__ = ["DatabaseResource", "MetadataField"]
 
 # Constants
 NOT_FOUND_STATUS = 404
 
 
+class MetadataField:
+    """
+    Read-only attribute that returns the value of a key of the metadata
+    (or None if the key is not present).
+
+    Replaces properties whose only logic is `return self.metadata.get(key)`,
+    reading the metadata dictionary directly once the object has been fetched.
+
+    Parameters
+    ----------
+    key : str
+        Key of the metadata dictionary.
+    doc : str, optional
+        Docstring of the attribute.
+
+    Examples
+    --------
+    >>> class Publisher(DatabaseResource):
+    ...     url = MetadataField("url", "The URL of the publisher's website.")
+    """
+
+    def __init__(self, key: str, doc: Optional[str] = None):
+        self.key = key
+        self.__doc__ = doc
+
+    def __get__(self, instance: Optional["DatabaseResource"], owner: type) -> Any:
+        if instance is None:
+            return self
+
+        instance._load(self.key)
+
+        return instance._metadata.get(self.key)
+
+    def __set__(self, instance: "DatabaseResource", value: Any) -> None:
+        raise AttributeError(
+            f"Attribute '{self.key}' is read-only. Use obj['{self.key}'] = value "
+            "to edit the metadata."
+        )
+
+
 class DatabaseResource:
     """
     Abstract base class for database objects (e.g., Dataset, Feature, and Publisher).
@@ -71,8 +107,26 @@ class DatabaseResource:
     classes for more information.
     """
 
+    # Instances are created in bulk (e.g. when listing), so they do not carry
+    # a __dict__ (weak references are kept by the object cache of the client)
+    __slots__ = (
+        "code",
+        "_client",
+        "_fetched",
+        "_metadata",
+        "_exists",
+        "_related",
+        "_preloaded",
+        "__weakref__",
+    )
+
+    # Fields of the lists (a tuple shared by every list request) and fields
+    # that can be edited (a frozenset, only used for membership checks)
     _LIST_FIELDS = None
     _EDITABLE_FIELDS = None
+    # Whether the metadata can be kept in the persistent cache of the client
+    # (reference objects that rarely change)
+    _PERSISTENT_CACHE = False
 
     def __init__(self, code: str, client: "Client", **kwargs):
         """
@@ -83,6 +137,43 @@ class DatabaseResource:
         self._fetched = False
         self._metadata = {"code": code, **kwargs}
         self._exists = None
+        self._related = {}
+        self._preloaded = frozenset()
+
+    @classmethod
+    def _from_dict(
+        cls, client: "Client", metadata: Dict[str, Any]
+    ) -> "DatabaseResource":
+        """
+        Creates an object from the metadata already returned by the API (e.g.
+        an item of a list), so that it is not fetched again.
+        """
+        obj = cls(code=metadata.get("code"), client=client)
+        obj._metadata = metadata
+        obj._fetched = True
+        obj._exists = True
+
+        return obj
+
+    @classmethod
+    def _from_list_item(
+        cls, client: "Client", item: Dict[str, Any]
+    ) -> "DatabaseResource":
+        """
+        Creates an object from an item of a list returned by the API. The
+        fields of the item are available without fetching the object, and the
+        rest of the metadata is fetched when first read.
+
+        Only the scalar fields are kept: related objects may be nested in the
+        items of a list and referenced by code in the metadata of the object.
+        """
+        obj = cls(code=item.get("code"), client=client)
+        fields = {k: v for k, v in item.items() if not isinstance(v, (dict, list))}
+        obj._metadata.update(fields)
+        obj._preloaded = frozenset(fields)
+        obj._exists = True
+
+        return obj
 
     def __repr__(self) -> str:
         """
@@ -99,7 +190,8 @@ class DatabaseResource:
         -----
         The first time this property is accessed, a request is made to the server to
         fetch the metadata. Subsequent accesses return the previously loaded information.
-        To update the metadata, create a new instance of the object.
+        To update the metadata, call `fetch` (if the client caches the metadata,
+        call `Client.invalidate` with the code of the object first).
         """
         if not self._fetched:
             self.fetch()
@@ -110,7 +202,30 @@ class DatabaseResource:
         """
         Provides a convenient way to access metadata attributes directly from the object.
         """
-        return self.metadata[key]
+        self._load(key)
+
+        return self._metadata[key]
+
+    def _load(self, key: str) -> None:
+        """
+        Fetches the object if the given metadata key is not loaded yet (objects
+        created from a list only have the fields included in the list).
+        """
+        if not self._fetched and key not in self._preloaded:
+            self.fetch()
+
+    def _get_related(self, code: str, kind: str) -> "DatabaseResource":
+        """
+        Returns the related object with the given code and kind (e.g. the scope
+        of a publisher). Objects are cached by (kind, code), so each related
+        object is only resolved (and fetched) once per instance, and a change in
+        the code referenced by the metadata resolves the new object.
+        """
+        key = (kind, code)
+        if key not in self._related:
+            self._related[key] = self._client.get(code=code, kind=kind)
+
+        return self._related[key]
 
     def _check_value(self, key: str, value: Any) -> Any:
         """
@@ -133,11 +248,11 @@ class DatabaseResource:
             # Check value
             self._check_value(key, value)
 
-            self.metadata[key] = value
+            self._metadata[key] = value
         else:
             raise AttributeError(
                 f"Attribute '{key}' is not editable."
-                f" Editable attributes are: {self._EDITABLE_FIELDS}."
+                f" Editable attributes are: {sorted(self._EDITABLE_FIELDS)}."
             )
 
     def fetch(self, fail_not_found: bool = True) -> "DatabaseResource":
@@ -154,7 +269,11 @@ class DatabaseResource:
 
         Notes
         -----
-        This method modifies the object's internal state.
+        This method modifies the object's internal state and invalidates the
+        cached related objects (see `invalidate_cache`). If the client was
+        created with a `fetch_cache_size` (or a `persistent_cache` for reference
+        objects such as categories), the metadata may be served from the client
+        cache without performing a request.
 
         Raises
         ------
@@ -163,6 +282,17 @@ class DatabaseResource:
         ObjectNotFound
             If the object is not found in the database.
         """
+        self.invalidate_cache()
+
+        metadata = self._client._get_cached_metadata(
+            self._URL, self.code, persistent=self._PERSISTENT_CACHE
+        )
+        if metadata is not None:
+            self._exists = True
+            self._metadata = metadata
+            self._fetched = True
+            return self
+
         relative_url = f"{self._URL}/{self.code}/"
         response = self._client._perform_request(
             relative_url, allowed_status=[NOT_FOUND_STATUS]
@@ -175,11 +305,21 @@ class DatabaseResource:
         else:
             self._exists = True
             self._metadata = response.json()
+            self._client._cache_metadata(
+                self._URL, self.code, self._metadata, persistent=self._PERSISTENT_CACHE
+            )
 
         self._fetched = True
 
         return self
 
+    def invalidate_cache(self) -> None:
+        """
+        Clears the related objects cached by the object (e.g. the categories or
+        the scope), so they are resolved again on the next access.
+        """
+        self._related.clear()
+
     def describe(self) -> str:
         """
         Returns a string representation of the object's metadata.
@@ -208,8 +348,9 @@ class DatabaseResource:
             Additional keyword arguments used to filter the list of objects.
         """
 
-        response = client._perform_request(cls._URL, params=kwargs)
-        data = response.json()
+        data = client._get_list(
+            cls._URL, params=kwargs, persistent=cls._PERSISTENT_CACHE
+        )
 
         data = _format_list_response(
             data, format=format, fields=cls._LIST_FIELDS, client=client, cls=cls
@@ -255,6 +396,7 @@ class DatabaseResource:
             method = "POST"
 
         self._client._perform_request(relative_url, method=method, json=self.metadata)
+        self._client.invalidate(self.code)
         self._save_subresources()
         self.fetch(fail_not_found=True)
 
@@ -270,6 +412,7 @@ class DatabaseResource:
 
         relative_url = f"{self._URL}/{self.code}/"
         self._client._perform_request(relative_url, method="DELETE")
+        self._client.invalidate(self.code)
         self._exists = False
 
     def from_dict(self, metadata):
@@ -23,16 +23,14 @@
 """
 This module contains the dataset class.
 """
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from warnings import warn
 
-try:  # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
-
+from .._compat import Literal
 from ..exceptions import ObjectNotFound
-from .base import DatabaseResource
+from ..utils import _concat_tables, _map_concurrently
+from .base import DatabaseResource, MetadataField
 from .dataset_version import Version
 from .mixins import CategoryMixin, ListFeaturesMixin, NameDescriptionMixin
 
@@ -127,12 +125,14 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
     >>> gdf = dataset.to_geopandas()
     """
 
+    __slots__ = ("_version_code", "_version", "_features")
+
     # URL used to perform requests to the database
     _URL = "dataset/"
     _FILTER_KEYWORD = "dataset"
 
     # Fields to be included in the list of datasets as a pandas dataframe
-    _LIST_FIELDS = [
+    _LIST_FIELDS = (
         "code",
         "name",
         "dataset_type",
@@ -148,36 +148,38 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
         "publisher_code",
         "publisher_name",
         "categories",
-    ]
-
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "name_es",
-        "is_public",
-        "description",
-        "description_es",
-        "order",
-        "last_update",
-        "preview",
-        "timestamp_column",
-        "start_data",
-        "last_data",
-        "n_time_slices",
-        "n_values",
-        "n_variables",
-        "n_features",
-        "next_update",
-        "update_frequency",
-        "granularity",
-        "categories",
-        "level",
-        "license",
-        "scope",
-        "publisher",
-        "related_datasets",
-        "dataset_documentation",
-    ]
+    )
+
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "name_es",
+            "is_public",
+            "description",
+            "description_es",
+            "order",
+            "last_update",
+            "preview",
+            "timestamp_column",
+            "start_data",
+            "last_data",
+            "n_time_slices",
+            "n_values",
+            "n_variables",
+            "n_features",
+            "next_update",
+            "update_frequency",
+            "granularity",
+            "categories",
+            "level",
+            "license",
+            "scope",
+            "publisher",
+            "related_datasets",
+            "dataset_documentation",
+        }
+    )
 
     def __init__(self, client, code: str, version: Optional[str] = None):
         """Initializes the Dataset object"""
@@ -191,7 +193,14 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
 
     @property
     def features(self) -> List["Feature"]:
-        """Dictionary with features indexed by column name (Dict[str, Feature], read-only)."""
+        """List of features of the dataset (List[Feature], read-only).
+
+        Notes
+        -----
+        The features are only resolved on first access (fetching the dataset
+        if needed), and the metadata of each feature is fetched when it is
+        first read.
+        """
 
         if self._features is None:
             self._features = [
@@ -201,72 +210,97 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
 
         return self._features
 
+    def _prefetch_features(self) -> List["Feature"]:
+        """Fetches the metadata of the features not fetched yet concurrently,
+        instead of one request after another when each feature is read."""
+        features = self.features
+        _map_concurrently(lambda f: f.fetch(), [f for f in features if not f._fetched])
+
+        return features
+
     @property
     def columns(self) -> List[str]:
-        """Return a list with all the columns of the dataset (List[str], read-only)."""
-        cols = [f.column for f in self.features]
+        """Return a list with all the columns of the dataset (List[str], read-only).
+
+        Notes
+        -----
+        Reads the column of every feature, which fetches the features that
+        have not been fetched yet (concurrently).
+        """
+        cols = [f.column for f in self._prefetch_features()]
         # Filter none values
         return [c for c in cols if c is not None]
 
     @property
     def version(self) -> "Version":
-        """Return the current version of the dataset (Version, read-only)."""
+        """Return the current version of the dataset (Version, read-only).
+
+        Notes
+        -----
+        If the dataset has already been fetched and its metadata includes the
+        current version, the versions of the dataset are not listed.
+        """
         if self._version is None:
-            versions = self.list_versions(format="json")
+            v = self._metadata.get("current_version") if self._fetched else None
+            if isinstance(v, dict):
+                v = v.get("code")
+
+            if v is None:
+                versions = self.list_versions(format="json")
 
-            if not len(versions):
-                raise ObjectNotFound("Version", self.code)
+                if not len(versions):
+                    raise ObjectNotFound("Version", self.code)
 
-            v = versions[-1].get("code")
+                v = versions[-1].get("code")
 
             self._version = self._client.get(code=v, kind="version")
 
         return self._version
 
-    @property
-    def timestamp_column(self) -> Union[str, None]:
-        """Name of the column used as timestamp (str, read-only)."""
-        return self.metadata.get("timestamp_column")
+    timestamp_column = MetadataField(
+        "timestamp_column",
+        "Name of the column used as timestamp (str, read-only).",
+    )
 
-    @property
-    def start_data(self) -> Union[str, None]:
-        """Start date of the dataset (str, read-only)."""
-        return self.metadata.get("start_data")
+    start_data = MetadataField(
+        "start_data",
+        "Start date of the dataset (str, read-only).",
+    )
 
-    @property
-    def last_data(self) -> Union[str, None]:
-        """Last date of the dataset (str, read-only)."""
-        return self.metadata.get("last_data")
+    last_data = MetadataField(
+        "last_data",
+        "Last date of the dataset (str, read-only).",
+    )
 
-    @property
-    def n_time_slices(self) -> Union[int, None]:
-        """Number of time slices in the dataset (int, read-only)."""
-        return self.metadata.get("n_time_slices")
+    n_time_slices = MetadataField(
+        "n_time_slices",
+        "Number of time slices in the dataset (int, read-only).",
+    )
 
-    @property
-    def n_values(self) -> Union[int, None]:
-        """Number of values in the dataset (int, read-only)."""
-        return self.metadata.get("n_values")
+    n_values = MetadataField(
+        "n_values",
+        "Number of values in the dataset (int, read-only).",
+    )
 
-    @property
-    def n_variables(self) -> Union[int, None]:
-        """Number of variables in the dataset (int, read-only)."""
-        return self.metadata.get("n_variables")
+    n_variables = MetadataField(
+        "n_variables",
+        "Number of variables in the dataset (int, read-only).",
+    )
 
-    @property
-    def n_features(self) -> Union[int, None]:
-        """Number of features in the dataset (int, read-only)."""
-        return self.metadata.get("n_features")
+    n_features = MetadataField(
+        "n_features",
+        "Number of features in the dataset (int, read-only).",
+    )
 
-    @property
-    def next_update(self) -> Union[str, None]:
-        """Next scheduled update of the dataset (str, read-only)."""
-        return self.metadata.get("next_update")
+    next_update = MetadataField(
+        "next_update",
+        "Next scheduled update of the dataset (str, read-only).",
+    )
 
-    @property
-    def last_update(self) -> Union[str, None]:
-        """Last update of the dataset (str, read-only)."""
-        return self.metadata.get("last_update")
+    last_update = MetadataField(
+        "last_update",
+        "Last update of the dataset (str, read-only).",
+    )
 
     @property
     def update_frequency(self) -> Union[str, None]:
@@ -283,22 +317,22 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
     @property
     def publisher(self) -> Union["Publisher", None]:
         """Name of the publisher of the dataset (str, read-only)."""
-        return self._client.get_publisher(code=self.metadata.get("publisher"))
+        return self._get_related(code=self.metadata.get("publisher"), kind="publisher")
 
     @property
     def license(self) -> Union["License", None]:
         """License of the dataset (str, read-only)."""
-        return self._client.get(code=self.metadata.get("license"), kind="license")
+        return self._get_related(code=self.metadata.get("license"), kind="license")
 
     @property
     def scope(self) -> Union["Scope", None]:
         """Scope of the dataset (dict, read-only)."""
-        return self._client.get(code=self.metadata.get("scope"), kind="scope")
+        return self._get_related(code=self.metadata.get("scope"), kind="scope")
 
     @property
     def level(self) -> Union["DataLevel", None]:
         """Level of the dataset (dict, read-only)."""
-        return self._client.get(code=self.metadata.get("level"), kind="data-level")
+        return self._get_related(code=self.metadata.get("level"), kind="data-level")
 
     def upload_file(
         self,
@@ -313,6 +347,22 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
 
         return file
 
+    def upload_files(
+        self,
+        files: Iterable[Union[str, "Path", "pd.DataFrame", "gpd.GeoDataFrame"]],
+        filetype: Optional[Literal["parquet", "geoparquet"]] = None,
+        update: bool = False,
+    ) -> List["File"]:
+        """Upload several files to the dataset concurrently.
+
+        See `Version.upload_files` for details.
+        """
+        files = self.version.upload_files(files=files, filetype=filetype, update=update)
+        # Flush current version
+        self._version = None
+
+        return files
+
     def set_version(self, version: str) -> "Version":
         versions = self.list_versions(format="json")
         #  Filter version lists by version_name
@@ -347,9 +397,15 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
         """
         return self._client.list(kind="version", dataset=self.code, format=format)
 
-    def to_pandas(self) -> "pd.DataFrame":
+    def to_pandas(self, columns: Optional[List[str]] = None) -> "pd.DataFrame":
         """Downloads the dataset as a pandas dataframe.
 
+        Parameters
+        ----------
+        columns : List[str], optional
+            Columns of the dataset to read. The rest of the columns are not
+            decoded. If None, all the columns are read. Defaults to None.
+
         Returns
         -------
         pandas.DataFrame
@@ -372,16 +428,43 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
                 "Use `dataset.version.list_files()` to see the available files for this version."
             )
 
+        if len(files) == 1:
+            return files[0].to_pandas(columns=columns)
+
         # Logic to handle multiple files (e.g. when the dataset is too big to fit in a single file)
-        df_list = []
-        for file in files:
-            df = file.to_pandas()
-            df_list.append(df)
+        # The files are downloaded concurrently and concatenated as arrow
+        # tables, so that the dataframe is only built once
+        tables = _map_concurrently(lambda file: file._to_arrow_table(columns), files)
+
+        return _concat_tables(tables).to_pandas(self_destruct=True, split_blocks=True)
 
-        if len(df_list) > 1:
-            df = pd.concat(df_list)
+    async def to_pandas_async(
+        self, columns: Optional[List[str]] = None
+    ) -> "pd.DataFrame":
+        """Downloads the dataset as a pandas dataframe without blocking the
+        event loop.
 
-        return df
+        Same as `to_pandas`, but run in a worker thread, so that several
+        datasets can be downloaded concurrently with `asyncio.gather`.
+
+        Parameters
+        ----------
+        columns : List[str], optional
+            Columns of the dataset to read. If None, all the columns are read.
+            Defaults to None.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe with the dataset.
+
+        Examples
+        --------
+        >>> datasets = [client.get(code) for code in codes]
+        >>> dfs = await asyncio.gather(*(d.to_pandas_async() for d in datasets))
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.to_pandas(columns))
 
     def _available_crosses(self, geometries: bool = False) -> List["Feature"]:
         """List available crosses of the dataset.
@@ -398,7 +481,7 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
         """
 
         available_crosses = [
-            d for d in self.features if d.reference_feature is not None
+            d for d in self._prefetch_features() if d.reference_feature is not None
         ]
 
         if geometries:
@@ -464,6 +547,7 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
             If the request fails due to an HTTP or Conection Error.
         """
         import geopandas as gpd
+        import pandas as pd
 
         files = self.version.list_files(filetype="geoparquet", format="api")
 
@@ -490,15 +574,19 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
             gdf = gpd.GeoDataFrame(gdf, geometry="geometry")
             return gdf
 
-        gdf_list = []
-        for file in files:
-            gdf = file.to_geopandas()
-            gdf_list.append(gdf)
+        # The files are downloaded concurrently
+        gdf_list = _map_concurrently(lambda file: file.to_geopandas(), files)
 
-        if len(gdf_list) > 1:
-            gdf = pd.concat(gdf_list)
+        if len(gdf_list) == 1:
+            return gdf_list[0]
 
-        return gdf
+        # Older versions of geopandas return a DataFrame when concatenating
+        first = gdf_list[0]
+        return gpd.GeoDataFrame(
+            pd.concat(gdf_list, ignore_index=True),
+            geometry=first.geometry.name,
+            crs=first.crs,
+        )
 
     def _check_value(self, key: str, value: Any) -> None:
         """
@@ -507,7 +595,7 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
         super()._check_value(key, value)
 
         if key == "granularity" or key == "update_frequency":
-            if value and value not in GRANULARITY_TYPES.keys():
+            if value and value not in GRANULARITY_TYPES:
                 raise ValueError(
                     f"Invalid {key}: {value}. Valid values are: {list(GRANULARITY_TYPES.keys())}"
                 )
@@ -535,37 +623,61 @@ class Dataset(DatabaseResource, CategoryMixin, NameDescriptionMixin, ListFeature
         requests.exceptions.RequestException.
             If the request fails due to an HTTP or Conection Error.
         """
+        self.add_features([feature])
 
-        if feature.column is None:
-            raise ValueError("The feature must have a column associated with it.")
+    def add_features(self, features: Iterable["Feature"]) -> None:
+        """Adds several features to the dataset.
 
-        if self._exists:
-            # Check if the feature is already in the dataset
-            columns = self.columns
-            codes = [f.code for f in self.features]
-
-            if feature.code in codes:
-                warn(
-                    f"The feature {feature.code} is already in the dataset.\n"
-                    f"Update the feature previously added instead of adding a new one.\n"
-                    f"Already added features: {codes}"
-                )
-                return
-            if feature.column in columns:
-                warn(
-                    f"The column {feature.column} is already in the dataset.\n"
-                    f"Update the feature previously added instead of adding a new one.\n"
-                    f"U"
-                )
-                return
+        Equivalent to calling `add_feature` for each feature, but the codes and
+        columns of the features already in the dataset are only collected once.
 
-        # Add the feature to the dataset
-        feature["dataset"] = self
+        Parameters
+        ----------
+        features : Iterable[Feature]
+            Features to add to the dataset.
 
-        # Case new dataset and first feature
-        if self._features is None:
-            self._features = []
-        self._features.append(feature)
+        Raises
+        ------
+        requests.exceptions.RequestException.
+            If the request fails due to an HTTP or Conection Error.
+        """
+        if self._exists:
+            codes = [f.code for f in self.features]
+            codes_set = set(codes)
+            columns = set(self.columns)
+
+        for feature in features:
+            if feature.column is None:
+                raise ValueError("The feature must have a column associated with it.")
+
+            if self._exists:
+                # Check if the feature is already in the dataset
+                if feature.code in codes_set:
+                    warn(
+                        f"The feature {feature.code} is already in the dataset.\n"
+                        f"Update the feature previously added instead of adding a new one.\n"
+                        f"Already added features: {codes}"
+                    )
+                    continue
+                if feature.column in columns:
+                    warn(
+                        f"The column {feature.column} is already in the dataset.\n"
+                        f"Update the feature previously added instead of adding a new one.\n"
+                        f"U"
+                    )
+                    continue
+
+                codes.append(feature.code)
+                codes_set.add(feature.code)
+                columns.add(feature.column)
+
+            # Add the feature to the dataset
+            feature["dataset"] = self
+
+            # Case new dataset and first feature
+            if self._features is None:
+                self._features = []
+            self._features.append(feature)
 
     def _save_subresources(self) -> None:
         """
@@ -23,17 +23,18 @@
 """
 This module contains the File class used to represent a file in the database.
 """
+import time
 import warnings
-from typing import TYPE_CHECKING, Union
-
-import requests
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from ..exceptions import ObjectNotFound
-from .base import DatabaseResource
+from ..utils import _get_transfer_session
+from .base import DatabaseResource, MetadataField
 
 # Import client Type for type checking
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
     from ..client import Client
 
@@ -44,6 +45,9 @@ if TYPE_CHECKING:
 
 __all__ = ["File"]
 
+# Size of the chunks read from the response when downloading a file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class File(DatabaseResource):
     """File of a dataset in the database
@@ -59,8 +63,15 @@ class File(DatabaseResource):
 
     """
 
+    __slots__ = ("_preview_warned", "_download_url")
+
     _URL = "file/"
 
+    # Seconds a download url is reused, and margin before its expiration
+    # after which a new one is requested
+    DOWNLOAD_URL_TTL = 300
+    DOWNLOAD_URL_MARGIN = 30
+
     def __init__(self, code: str, client: "Client", **kwargs):
         """
         Initializes the object with the provided code and client instance.
@@ -80,6 +91,8 @@ class File(DatabaseResource):
         information is initialized after is required.
         """
         super().__init__(code, client, **kwargs)
+        self._preview_warned = False
+        self._download_url = None
 
     def get_download_url(self) -> str:
         """URL used to download the file (`str`, read-only).
@@ -102,15 +115,30 @@ class File(DatabaseResource):
                 f"File with code {self.code} not found in the database."
             )
 
-        if response.get("preview"):  # Warn about preview downloaded
+        self._download_url = (url, time.monotonic() + self.DOWNLOAD_URL_TTL)
+
+        # Warn about preview downloaded (only once per file)
+        if response.get("preview") and not self._preview_warned:
+            self._preview_warned = True
             warnings.warn(
                 "This file is not available in your plan. "
                 "You are downloading a preview of the file with a few example rows. "
                 "To download the full file, please change your plan or contact us at "
-                "https://dratio.io/contact."
+                "https://dratio.io/contact.",
+                stacklevel=2,
             )
 
         return url
+
+    def _get_cached_download_url(self) -> str:
+        """Returns the last download url issued for the file while it is still
+        valid, requesting a new one otherwise."""
+        if self._download_url is not None:
+            url, expires_at = self._download_url
+            if time.monotonic() < expires_at - self.DOWNLOAD_URL_MARGIN:
+                return url
+
+        return self.get_download_url()
     
     def _update_availability(self) -> None:
         """Updates the availability information of the file.
@@ -125,30 +153,79 @@ class File(DatabaseResource):
         response = response.json()
 
 
-    @property
-    def filetype(self) -> Union[str, None]:
-        """Filetype of the file (e.g. parquet, geoparquet, etc) (`str`, read-only)."""
-        return self.metadata.get("filetype")
+    def _download(self) -> "pa.BufferReader":
+        """Downloads the content of the file through the pooled session shared
+        by the file transfers (keep-alive connections across files).
 
-    @property
-    def size(self) -> Union[int, None]:
-        """Size of the file in bytes (`int`, read-only)."""
-        return self.metadata.get("size")
+        When the size is known, the body is streamed into a buffer allocated
+        once, which is then read by pyarrow without copies (instead of joining
+        the chunks of the response and wrapping them in another file object).
 
-    @property
-    def start_time(self) -> Union[str, None]:
-        """Start time of the file (`str`, read-only)."""
-        return self.metadata.get("start_time")
+        The download url is reused while it is valid, and requested again if
+        the storage service rejects it.
+        """
+        import pyarrow as pa
+        from requests.exceptions import ChunkedEncodingError
+
+        session = _get_transfer_session()
+        url = self._get_cached_download_url()
+        response = session.get(url, allow_redirects=True, stream=True)
+        if response.status_code == 403:
+            response.close()
+            response = session.get(
+                self.get_download_url(), allow_redirects=True, stream=True
+            )
+        response.raise_for_status()
+
+        size = response.headers.get("Content-Length")
+        # Encoded bodies are decoded on the fly, so their size is not known
+        if size is None or response.headers.get("Content-Encoding"):
+            return pa.BufferReader(response.content)
+
+        buffer = bytearray(int(size))
+        view = memoryview(buffer)
+        position = 0
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if position + len(chunk) > len(buffer):
+                raise ChunkedEncodingError(
+                    f"Invalid download of file {self.code}: more than the "
+                    f"{len(buffer)} bytes announced received."
+                )
+            view[position : position + len(chunk)] = chunk
+            position += len(chunk)
+
+        if position != len(buffer):
+            raise ChunkedEncodingError(
+                f"Incomplete download of file {self.code}: "
+                f"{position} of {len(buffer)} bytes received."
+            )
 
-    @property
-    def end_time(self) -> Union[str, None]:
-        """End time of the file (`str`, read-only)."""
-        return self.metadata.get("end_time")
+        return pa.BufferReader(buffer)
 
-    @property
-    def updated_at(self) -> Union[str, None]:
-        """Date when the file was last updated (`str`, read-only)."""
-        return self.metadata.get("updated_at")
+    filetype = MetadataField(
+        "filetype",
+        "Filetype of the file (e.g. parquet, geoparquet, etc) (`str`, read-only).",
+    )
+
+    size = MetadataField(
+        "size",
+        "Size of the file in bytes (`int`, read-only).",
+    )
+
+    start_time = MetadataField(
+        "start_time",
+        "Start time of the file (`str`, read-only).",
+    )
+
+    end_time = MetadataField(
+        "end_time",
+        "End time of the file (`str`, read-only).",
+    )
+
+    updated_at = MetadataField(
+        "updated_at",
+        "Date when the file was last updated (`str`, read-only).",
+    )
 
     @property
     def version(self) -> Union[str, None]:
@@ -156,7 +233,7 @@ class File(DatabaseResource):
         value = self.metadata.get("version")
         if value is None:
             return None
-        return self._client.get(code=value, kind="version")
+        return self._get_related(code=value, kind="version")
 
     @property
     def dataset(self) -> Union[str, None]:
@@ -166,9 +243,24 @@ class File(DatabaseResource):
             return None
         return v.dataset
 
-    def to_pandas(self) -> "pd.DataFrame":
+    def _to_arrow_table(self, columns: Optional[List[str]] = None) -> "pa.Table":
+        """Downloads the file as an arrow table, reading only the given
+        columns (and the index stored in the pandas metadata)."""
+        import pyarrow.parquet as pq
+
+        return pq.read_table(
+            self._download(), columns=columns, use_pandas_metadata=True
+        )
+
+    def to_pandas(self, columns: Optional[List[str]] = None) -> "pd.DataFrame":
         """Downloads the dataset as a pandas dataframe.
 
+        Parameters
+        ----------
+        columns : List[str], optional
+            Columns to read from the file. If None, all the columns are read.
+            Defaults to None.
+
         Returns
         -------
         pandas.DataFrame
@@ -182,8 +274,7 @@ class File(DatabaseResource):
         # Import pandas here to avoid importing it if not needed
         import pandas as pd
 
-        url = self.get_download_url()
-        df = pd.read_parquet(url)
+        df = pd.read_parquet(self._download(), engine="pyarrow", columns=columns)
 
         return df
 
@@ -207,9 +298,6 @@ class File(DatabaseResource):
             If the request fails due to an HTTP or Conection Error.
         """
 
-        # Dependencies used only in this method
-        import io
-
         try:
             import geopandas as gpd
 
@@ -226,9 +314,6 @@ class File(DatabaseResource):
                 "Please, use the `to_pandas` method to download the dataset."
             )
 
-        url = self.get_download_url()
-        r = requests.get(url, allow_redirects=True)
-        f = io.BytesIO(r.content)
-        gdf = gpd.read_parquet(f)
+        gdf = gpd.read_parquet(self._download())
 
         return gdf
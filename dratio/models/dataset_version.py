@@ -23,13 +23,10 @@
 """
 This module contains the Version class used to represent a file in the database.
 """
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
-
-try:  # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
+from .._compat import Literal
+from ..utils import _map_concurrently
 from .mixins import NameDescriptionMixin
 
 from .base import DatabaseResource
@@ -61,6 +58,8 @@ class Version(DatabaseResource, NameDescriptionMixin):
 
     """
 
+    __slots__ = ()
+
     _URL = "version/"
 
     @property
@@ -68,7 +67,7 @@ class Version(DatabaseResource, NameDescriptionMixin):
         """Dataset to which the version belongs"""
 
         dataset_code = self.metadata.get("dataset", {}).get("code")
-        return self._client.get_dataset(code=dataset_code)
+        return self._get_related(code=dataset_code, kind="dataset")
 
     def upload_file(
         self,
@@ -97,12 +96,43 @@ class Version(DatabaseResource, NameDescriptionMixin):
         version_code = content["version"]
 
         _upload_file(file=file, filetype=filetype, url=url)
+        self._client.invalidate(self.code)
 
         new_file = self._client.get_file(code=file_code)
         new_file._update_availability()
 
         return new_file
 
+    def upload_files(
+        self,
+        files: Iterable[Union[str, "Path", "pd.DataFrame", "gpd.GeoDataFrame"]],
+        filetype: Optional[Literal["parquet", "geoparquet"]] = None,
+        update: bool = False,
+    ) -> List["File"]:
+        """Uploads several files to the version.
+
+        The uploads are performed concurrently, so the total time is bounded
+        by the bandwidth instead of the sum of the round trips of each upload.
+
+        Parameters
+        ----------
+        files : Iterable[Union[str, Path, pd.DataFrame, gpd.GeoDataFrame]]
+            Files to upload (paths or dataframes).
+        filetype : Optional[str]
+            Filetype of all the files. If None, it is inferred for each file.
+        update : bool
+            Whether to replace the files if they already exist.
+
+        Returns
+        -------
+        List[File]
+            File objects representing the uploaded files, in the same order.
+        """
+        return _map_concurrently(
+            lambda file: self.upload_file(file=file, filetype=filetype, update=update),
+            files,
+        )
+
     def list_files(
         self,
         filetype: Optional[Literal["parquet", "geoparquet"]] = None,
@@ -123,6 +153,14 @@ class Version(DatabaseResource, NameDescriptionMixin):
         Literal["pandas", "json"]
             List of files associated to the version.
         """
+        if format == "api":
+            # Files are built from the listed metadata, without a request per file
+            file_cls = self._client._resolve_class("file")
+            files = self._client.list(
+                kind="file", format="json", version=self.code, filetype=filetype
+            )
+            return [file_cls._from_dict(client=self._client, metadata=f) for f in files]
+
         return self._client.list(
             kind="file", format=format, version=self.code, filetype=filetype
         )
@@ -25,13 +25,8 @@ This module contains the Feature class.
 """
 from typing import TYPE_CHECKING, Dict, Union, Any
 
-
-try:
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
-
-from .base import DatabaseResource
+from .._compat import Literal
+from .base import DatabaseResource, MetadataField
 from .mixins import NameDescriptionMixin, CategoryMixin
 
 if TYPE_CHECKING:  # Pandas only as as type hint
@@ -113,8 +108,10 @@ class Feature(DatabaseResource, NameDescriptionMixin, CategoryMixin):
 
     """
 
+    __slots__ = ()
+
     _URL = "feature/"
-    _LIST_FIELDS = [
+    _LIST_FIELDS = (
         "code",
         "name",
         "column",
@@ -132,31 +129,33 @@ class Feature(DatabaseResource, NameDescriptionMixin, CategoryMixin):
         "level_code",
         "level_name",
         "categories",
-    ]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
+    )
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "column",
+            "description",
+            "publisher",
+            "dataset",
+            "n_values",
+            "is_unique",
+            "n_not_null",
+            "order",
+            "feature_type",
+            "data_type",
+            "license",
+            "name_es",
+            "description_es",
+            "reference_feature",
+            "crs",
+        }
+    )
+
+    column = MetadataField(
         "column",
-        "description",
-        "publisher",
-        "dataset",
-        "n_values",
-        "is_unique",
-        "n_not_null",
-        "order",
-        "feature_type",
-        "data_type",
-        "license",
-        "name_es",
-        "description_es",
-        "reference_feature",
-        "crs",
-    ]
-
-    @property
-    def column(self) -> Union[str, None]:
-        """The column name representing the feature in the dataset (`str`, read-only)."""
-        return self.metadata.get("column")
+        "The column name representing the feature in the dataset (`str`, read-only).",
+    )
 
     @property
     def feature_type(
@@ -200,50 +199,50 @@ class Feature(DatabaseResource, NameDescriptionMixin, CategoryMixin):
         if raw_data_type:
             return DATA_TYPES.get(raw_data_type)
 
-    @property
-    def last_update(self) -> Union[str, None]:
-        """Date of the last update of the feature (`str`, read-only)."""
-        return self.metadata.get("last_update")
+    last_update = MetadataField(
+        "last_update",
+        "Date of the last update of the feature (`str`, read-only).",
+    )
 
-    @property
-    def next_update(self) -> Union[str, None]:
-        """Date of the next update of the feature (`str`, read-only)."""
-        return self.metadata.get("next_update")
+    next_update = MetadataField(
+        "next_update",
+        "Date of the next update of the feature (`str`, read-only).",
+    )
 
-    @property
-    def update_frequency(self) -> Union[str, None]:
-        """Frequency of the updates of the feature (`str`, read-only)."""
-        return self.metadata.get("update_frequency")
+    update_frequency = MetadataField(
+        "update_frequency",
+        "Frequency of the updates of the feature (`str`, read-only).",
+    )
 
     @property
     def dataset(self) -> Union["Dataset", None]:
         """Dataset to which the feature belongs (`Dataset`, read-only)."""
-        return self._client.get(code=self.metadata.get("dataset"), kind="dataset")
+        return self._get_related(code=self.metadata.get("dataset"), kind="dataset")
 
-    @property
-    def start_data(self) -> Union[str, None]:
-        """Date of the first observation of the feature (`str`, read-only)."""
-        return self.metadata.get("start_data")
+    start_data = MetadataField(
+        "start_data",
+        "Date of the first observation of the feature (`str`, read-only).",
+    )
 
-    @property
-    def last_data(self) -> Union[str, None]:
-        """Date of the last observation of the feature (`str`, read-only)."""
-        return self.metadata.get("last_data")
+    last_data = MetadataField(
+        "last_data",
+        "Date of the last observation of the feature (`str`, read-only).",
+    )
 
     @property
     def scope(self) -> Union[Dict[str, str], None]:
         """Scope of the feature (`dict`, read-only)."""
-        return self._client.get(code=self.metadata.get("scope"), kind="scope")
+        return self._get_related(code=self.metadata.get("scope"), kind="scope")
 
     @property
     def data_level(self) -> Union[Dict[str, str], None]:
         """Level of the feature (`dict`, read-only)."""
-        return self._client.get(code=self.metadata.get("level"), kind="data-level")
+        return self._get_related(code=self.metadata.get("level"), kind="data-level")
 
     @property
     def publisher(self) -> Union["Publisher", None]:
         """Publisher to which the feature belongs (`Publisher`, read-only)."""
-        return self._client.get(code=self.metadata.get("publisher"), kind="publisher")
+        return self._get_related(code=self.metadata.get("publisher"), kind="publisher")
 
     @property
     def license(self) -> Union["License", None]:
@@ -251,19 +250,19 @@ class Feature(DatabaseResource, NameDescriptionMixin, CategoryMixin):
         license_code = self.metadata.get("license")
         dataset_license_code = self.metadata.get("dataset_license")
         license_code = license_code or dataset_license_code
-        return self._client.get(code=license_code, kind="license")
+        return self._get_related(code=license_code, kind="license")
 
     @property
     def reference_feature(self) -> Union["Feature", None]:
         """Feature to which the feature belongs (`Feature`, read-only)."""
-        return self._client.get(
+        return self._get_related(
             code=self.metadata.get("reference_feature"), kind="feature"
         )
 
     @property
     def reference(self) -> Union["Dataset", None]:
         """Dataset to which the feature belongs (`Dataset`, read-only)."""
-        return self._client.get(code=self.metadata.get("reference"), kind="dataset")
+        return self._get_related(code=self.metadata.get("reference"), kind="dataset")
 
     def _check_value(self, key: str, value: Any) -> None:
         """
@@ -272,13 +271,13 @@ class Feature(DatabaseResource, NameDescriptionMixin, CategoryMixin):
         super()._check_value(key, value)
 
         if key == "feature_type":
-            if value and value not in FEATURE_TYPES.keys():
+            if value and value not in FEATURE_TYPES:
                 raise ValueError(
                     f"Invalid feature_type: {value}. Valid values are: {list(FEATURE_TYPES.keys())}"
                 )
 
         elif key == "data_type":
-            if value and value not in DATA_TYPES.keys():
+            if value and value not in DATA_TYPES:
                 raise ValueError(
                     f"Invalid data_type: {value}. Valid values are: {list(DATA_TYPES.keys())}"
                 )
@@ -27,13 +27,10 @@ This module contains the license and license item classes.
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 from .mixins import NameDescriptionMixin, ListDatasetsMixin, ListFeaturesMixin, ListPublisherMixin
 
+from .._compat import Literal
+from ..utils import _map_concurrently
 from .base import DatabaseResource
 
-try: # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
-
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -45,11 +42,22 @@ class License(DatabaseResource, ListFeaturesMixin, ListDatasetsMixin, ListPublis
     Class to represent a category in the database.
     """
 
+    __slots__ = ("_license_items",)
+
     _URL = "license/"
     _FILTER_KEYWORD = "license"
-    _LIST_FIELDS = ["code", "name", "url"]
-    _EDITABLE_FIELDS = ["code", "name", "url", "description",
-                        "name_es", "description_es", "is_public"]
+    _LIST_FIELDS = ("code", "name", "url")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "url",
+            "description",
+            "name_es",
+            "description_es",
+            "is_public",
+        }
+    )
 
     @property
     def license_items(self) -> List["LicenseItem"]:
@@ -125,10 +133,12 @@ class License(DatabaseResource, ListFeaturesMixin, ListDatasetsMixin, ListPublis
 
         super()._save_subresources()
 
-        # Save the license items
-        for item in self.license_items.values():
+        # Save the license items (independent requests, performed concurrently)
+        items = list(self.license_items.values())
+        for item in items:
             item['license'] = self.code
-            item.save()
+
+        _map_concurrently(lambda item: item.save(), items)
 
 
 class LicenseItem(DatabaseResource, NameDescriptionMixin):
@@ -136,23 +146,27 @@ class LicenseItem(DatabaseResource, NameDescriptionMixin):
     Class to represent a license item in the database.
     """
 
+    __slots__ = ()
+
     _URL = "license-item/"
-    _LIST_FIELDS = ["code", "name", "license", "grant"]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "description",
-        "grant",
-        "name_es",
-        "description_es",
-        "is_public",
-        'license',
-        'order'
-    ]
+    _LIST_FIELDS = ("code", "name", "license", "grant")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "description",
+            "grant",
+            "name_es",
+            "description_es",
+            "is_public",
+            "license",
+            "order",
+        }
+    )
 
     @ property
     def license(self) -> "License":
         """
         Get the license of the license item.
         """
-        return self._client.get(code=self.metadata.get("license"), kind="license")
+        return self._get_related(code=self.metadata.get("license"), kind="license")
@@ -25,7 +25,10 @@ This module contains abstract classes to be used as mixins in the
 models.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Union
+
+from .._compat import Literal
+from ..utils import _map_concurrently
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -34,10 +37,36 @@ if TYPE_CHECKING:
     from .publisher import Publisher
     from .tags import Category
 
-try:  #  Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
+
+def _list_bulk(
+    objects: Iterable[Any], method: str, format: Literal["pandas", "json", "api"]
+) -> Dict[str, Any]:
+    """Calls a list method (e.g. `list_datasets`) of several objects, performing
+    the requests concurrently, and returns the results indexed by object code.
+
+    Implements the `list_*_bulk` class methods of the mixins: listing the
+    related objects of many objects waits for about one round trip instead of
+    one per object.
+
+    Arguments
+    ---------
+    objects : Iterable
+        Objects that implement `method`.
+    method : str
+        Name of the list method (e.g. "list_features").
+    format : str
+        Format of each output. Either "pandas", "json" or "api".
+
+    Returns
+    -------
+    Dict[str, Any]
+        Output of the method for each object, indexed by the object code.
+    """
+    objects = list(objects)
+    results = _map_concurrently(
+        lambda obj: getattr(obj, method)(format=format), objects
+    )
+    return {obj.code: result for obj, result in zip(objects, results)}
 
 
 class ListFeaturesMixin:
@@ -45,6 +74,8 @@ class ListFeaturesMixin:
     Mixin to add the list_dataset method to a model.
     """
 
+    __slots__ = ()
+
     def list_features(
         self, format: Literal["pandas", "json", "api"] = "pandas"
     ) -> Union["pd.DataFrame", List[Dict[str, Any]], List["Feature"]]:
@@ -106,12 +137,35 @@ class ListFeaturesMixin:
 
         return self._client.list_features(format=format, **filters)
 
+    @classmethod
+    def list_features_bulk(
+        cls,
+        objects: Iterable[Any],
+        format: Literal["pandas", "json", "api"] = "pandas",
+    ) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]], List["Feature"]]]:
+        """Returns the features associated to several objects (e.g. datasets,
+        publishers or licenses) at once, indexed by the object code. The
+        requests are performed concurrently. See `list_features` for the
+        formats.
+
+        Examples
+        --------
+
+        >>> from dratio.models import Dataset
+        >>> datasets = client.list_datasets(format="api")
+        >>> features = Dataset.list_features_bulk(datasets)
+
+        """
+        return _list_bulk(objects, method="list_features", format=format)
+
 
 class ListDatasetsMixin:
     """
     Mixin to add the list_dataset method to a model.
     """
 
+    __slots__ = ()
+
     def list_datasets(
         self, format: Literal["pandas", "json", "api"] = "pandas"
     ) -> Union["pd.DataFrame", List[Dict[str, Any]], List["Dataset"]]:
@@ -173,12 +227,34 @@ class ListDatasetsMixin:
 
         return self._client.list_datasets(format=format, **filters)
 
+    @classmethod
+    def list_datasets_bulk(
+        cls,
+        objects: Iterable[Any],
+        format: Literal["pandas", "json", "api"] = "pandas",
+    ) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]], List["Dataset"]]]:
+        """Returns the datasets associated to several objects (e.g. publishers
+        or licenses) at once, indexed by the object code. The requests are
+        performed concurrently. See `list_datasets` for the formats.
+
+        Examples
+        --------
+
+        >>> from dratio.models import Publisher
+        >>> publishers = client.list_publishers(format="api")
+        >>> datasets = Publisher.list_datasets_bulk(publishers)
+
+        """
+        return _list_bulk(objects, method="list_datasets", format=format)
+
 
 class ListPublisherMixin:
     """
     Mixin to add the list_publishers method to a model.
     """
 
+    __slots__ = ()
+
     def list_publishers(
         self, format: Literal["pandas", "json", "api"] = "pandas"
     ) -> Union["pd.DataFrame", List[Dict[str, Any]], List["Publisher"]]:
@@ -227,16 +303,39 @@ class ListPublisherMixin:
 
         return self._client.list_publishers(format=format, **filters)
 
+    @classmethod
+    def list_publishers_bulk(
+        cls,
+        objects: Iterable[Any],
+        format: Literal["pandas", "json", "api"] = "pandas",
+    ) -> Dict[str, Union["pd.DataFrame", List[Dict[str, Any]], List["Publisher"]]]:
+        """Returns the publishers associated to several objects (e.g. licenses)
+        at once, indexed by the object code. The requests are performed
+        concurrently. See `list_publishers` for the formats.
+
+        Examples
+        --------
+
+        >>> from dratio.models import License
+        >>> licenses = client.list(kind="license", format="api")
+        >>> publishers = License.list_publishers_bulk(licenses)
+
+        """
+        return _list_bulk(objects, method="list_publishers", format=format)
+
 
 class CategoryMixin:
     """
     Mixin for models that have a categories.
     """
+
+    __slots__ = ()
+
     @property
     def categories(self) -> List["Category"]:
         """Returns the categories associated to the object."""
         cat = self.metadata.get("categories", [])
-        return [self._client.get(code=c, kind="category") for c in cat]
+        return [self._get_related(code=c, kind="category") for c in cat]
 
 
 class NameDescriptionMixin:
@@ -244,12 +343,16 @@ class NameDescriptionMixin:
     Mixin for models that have a name and a description.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Returns the name of the object."""
-        return self.metadata.get("name", "")
+        self._load("name")
+        return self._metadata.get("name", "")
 
     @property
     def description(self) -> str:
         """Returns the description of the object."""
-        return self.metadata.get("description", "")
+        self._load("description")
+        return self._metadata.get("description", "")
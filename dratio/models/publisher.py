@@ -27,7 +27,7 @@ from which datasets are obtained.
 from typing import TYPE_CHECKING, Dict, List, Union
 
 
-from .base import DatabaseResource
+from .base import DatabaseResource, MetadataField
 from .mixins import (
     ListDatasetsMixin,
     ListFeaturesMixin,
@@ -89,9 +89,11 @@ class Publisher(
 
     """
 
+    __slots__ = ()
+
     _URL = "publisher/"
     _FILTER_KEYWORD = "publisher"
-    _LIST_FIELDS = [
+    _LIST_FIELDS = (
         "code",
         "name",
         "url",
@@ -106,80 +108,82 @@ class Publisher(
         "publisher_type_code",
         "publisher_type_name",
         "categories",
-    ]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "is_public",
-        "scope",
-        "license",
-        "order",
-        "last_update",
-        "description",
-        "categories",
+    )
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "is_public",
+            "scope",
+            "license",
+            "order",
+            "last_update",
+            "description",
+            "categories",
+            "url",
+            "n_datasets",
+            "n_variables",
+            "n_features",
+            "publisher_type",
+            "start_data",
+            "last_data",
+        }
+    )
+
+    url = MetadataField(
         "url",
-        "n_datasets",
-        "n_variables",
-        "n_features",
-        "publisher_type",
-        "start_data",
-        "last_data",
-    ]
-
-    @property
-    def url(self) -> Union[str, None]:
-        """The URL of the publisher's website (`str`, read-only)."""
-        return self.metadata.get("url")
+        "The URL of the publisher's website (`str`, read-only).",
+    )
 
-    @property
-    def last_update(self) -> Union[str, None]:
-        """The date when the publisher's information was last updated (`str`, read-only)."""
-        return self.metadata.get("last_update")
+    last_update = MetadataField(
+        "last_update",
+        "The date when the publisher's information was last updated (`str`, read-only).",
+    )
 
     @property
     def categories(self) -> List[Dict[str, str]]:
         """The categories associated with the publisher (`str`, read-only)."""
         return self.metadata.get("categories", [])
 
-    @property
-    def n_datasets(self) -> Union[int, None]:
-        """The number of datasets associated with the publisher (`int`, read-only)."""
-        return self.metadata.get("n_datasets")
+    n_datasets = MetadataField(
+        "n_datasets",
+        "The number of datasets associated with the publisher (`int`, read-only).",
+    )
 
-    @property
-    def n_variables(self) -> Union[int, None]:
-        """The number of variables associated with the publisher (`int`, read-only)."""
-        return self.metadata.get("n_variables")
+    n_variables = MetadataField(
+        "n_variables",
+        "The number of variables associated with the publisher (`int`, read-only).",
+    )
 
-    @property
-    def n_features(self) -> Union[int, None]:
-        """The number of features associated with the publisher (`int`, read-only)."""
-        return self.metadata.get("n_features")
+    n_features = MetadataField(
+        "n_features",
+        "The number of features associated with the publisher (`int`, read-only).",
+    )
 
-    @property
-    def start_data(self) -> Union[str, None]:
-        """The start date of the data provided by the publisher (`str`, read-only)."""
-        return self.metadata.get("start_data")
+    start_data = MetadataField(
+        "start_data",
+        "The start date of the data provided by the publisher (`str`, read-only).",
+    )
 
-    @property
-    def last_data(self) -> Union[str, None]:
-        """The last date of the data provided by the publisher (`str`, read-only)."""
-        return self.metadata.get("last_data")
+    last_data = MetadataField(
+        "last_data",
+        "The last date of the data provided by the publisher (`str`, read-only).",
+    )
 
     @property
     def scope(self) -> Union["Scope", None]:
         """The scope of the publisher (`dict`, read-only)."""
         scope_code = self.metadata.get("scope")
-        return self._client.get(code=scope_code, kind="scope")
+        return self._get_related(code=scope_code, kind="scope")
 
     @property
     def publisher_type(self) -> Union["PusblisherType", None]:
         """The type of the publisher (`dict`, read-only)."""
         publisher_code = self.metadata.get("publisher_type")
-        return self._client.get(code=publisher_code, kind="publisher-type")
+        return self._get_related(code=publisher_code, kind="publisher-type")
 
     @property
     def license(self) -> Union["License", None]:
         """The license of the publisher (`dict`, read-only)."""
         license_code = self.metadata.get("license")
-        return self._client.get(code=license_code, kind="license")
+        return self._get_related(code=license_code, kind="license")
@@ -40,17 +40,22 @@ class Category(DatabaseResource, NameDescriptionMixin):
     A category is a tag that describes the nature of the data.
     """
 
+    __slots__ = ()
+
+    _PERSISTENT_CACHE = True
     _URL = "category/"
-    _LIST_FIELDS = ["code", "name"]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "description",
-        "icon",
-        "name_es",
-        "description_es",
-        "is_public",
-    ]
+    _LIST_FIELDS = ("code", "name")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "description",
+            "icon",
+            "name_es",
+            "description_es",
+            "is_public",
+        }
+    )
 
 
 class Scope(DatabaseResource, NameDescriptionMixin):
@@ -60,17 +65,22 @@ class Scope(DatabaseResource, NameDescriptionMixin):
     A scope is a tag that describes the geographical scope of the data.
     """
 
+    __slots__ = ()
+
+    _PERSISTENT_CACHE = True
     _URL = "scope/"
-    _LIST_FIELDS = ["code", "name"]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "description",
-        "icon",
-        "name_es",
-        "description_es",
-        "is_public",
-    ]
+    _LIST_FIELDS = ("code", "name")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "description",
+            "icon",
+            "name_es",
+            "description_es",
+            "is_public",
+        }
+    )
 
 
 class Unit(DatabaseResource, NameDescriptionMixin):
@@ -80,9 +90,20 @@ class Unit(DatabaseResource, NameDescriptionMixin):
     A unit is a tag that describes the unit of measurement of the data.
     """
 
+    __slots__ = ()
+
+    _PERSISTENT_CACHE = True
     _URL = "unit/"
-    _LIST_FIELDS = ["code", "name", "symbol"]
-    _EDITABLE_FIELDS = ["code", "name", "symbol", "name_es", "is_public"]
+    _LIST_FIELDS = ("code", "name", "symbol")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "symbol",
+            "name_es",
+            "is_public",
+        }
+    )
 
 
 class PusblisherType(DatabaseResource, NameDescriptionMixin):
@@ -92,9 +113,20 @@ class PusblisherType(DatabaseResource, NameDescriptionMixin):
     A unit is a tag that describes the unit of measurement of the data.
     """
 
+    __slots__ = ()
+
+    _PERSISTENT_CACHE = True
     _URL = "publisher-type/"
-    _LIST_FIELDS = ["code", "name"]
-    _EDITABLE_FIELDS = ["code", "name", "icon", "name_es", "is_public"]
+    _LIST_FIELDS = ("code", "name")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "icon",
+            "name_es",
+            "is_public",
+        }
+    )
 
 
 class DataLevel(DatabaseResource, NameDescriptionMixin):
@@ -104,14 +136,19 @@ class DataLevel(DatabaseResource, NameDescriptionMixin):
     A unit is a tag that describes the unit of measurement of the data.
     """
 
+    __slots__ = ()
+
+    _PERSISTENT_CACHE = True
     _URL = "data-level/"
-    _LIST_FIELDS = ["code", "name"]
-    _EDITABLE_FIELDS = [
-        "code",
-        "name",
-        "description",
-        "icon",
-        "name_es",
-        "description_es",
-        "is_public",
-    ]
+    _LIST_FIELDS = ("code", "name")
+    _EDITABLE_FIELDS = frozenset(
+        {
+            "code",
+            "name",
+            "description",
+            "icon",
+            "name_es",
+            "description_es",
+            "is_public",
+        }
+    )
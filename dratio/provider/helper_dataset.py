@@ -1,147 +1,203 @@
-from typing import TYPE_CHECKING, Optional, Union
-
-import geopandas as gpd
-import pandas as pd
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from dratio.exceptions import ObjectNotFound
+from dratio.utils import _is_geodataframe, _map_concurrently
 
 if TYPE_CHECKING:
+    import geopandas as gpd
+    import pandas as pd
+
     from ..client import Client
     from ..models.dataset import Dataset
+    from ..models.feature import Feature
+
+# Escapes newlines and quotes of string values in a single pass
+_ESCAPE_TABLE = str.maketrans({"\n": "\\n", "'": "\\'", '"': '\\"'})
+
+# Comment and default value of a field of the code snippet
+FieldSpec = namedtuple("FieldSpec", ["comment", "default"])
 
 dataset_fileds_mapping = {
-    "name": {
-        "comment": "# Name of the dataset (English)",
-        "default": "Here the name in English",
-    },
-    "name_es": {
-        "comment": "# Name of the dataset (Spanish)",
-        "default": "Nombre en Español",
-    },
-    "description": {
-        "comment": "# Description of the dataset (English)",
-        "default": "Here the description in English",
-    },
-    "description_es": {
-        "comment": "# Description of the dataset (Spanish)",
-        "default": "Descripción en Español",
-    },
-    "license": {
-        "comment": "# License of the dataset (e.g. 'ine') -> get existing with client.list('license')",
-        "default": "",
-    },
-    "publisher": {
-        "comment": "# Publisher of the dataset (e.g. 'ine') -> get existing with client.list('publisher')",
-        "default": "ine",
-    },
-    "scope": {
-        "comment": "# Scope of the dataset -> get all scopes with client.list('scope')\n    # Example scopes: ['europe', 'spain', 'without-scope']",
-        "default": "spain",
-    },
-    "order": {
-        "comment": "# Order of the dataset in the marketplace (lower is first)",
-        "default": 5,
-    },
-    "is_public": {
-        "comment": "# Should be the dataset shown to non-admin users?",
-        "default": True,
-    },
-    "categories": {
-        "comment": "# list of categories of the dataset -> get existing with client.list('category')\n    # Example categories: ['employment', 'geospatial', 'population', 'socioeconomic']",
-        "default": ["socioeconomic", "population"],
-    },
-    "level": {
-        "comment": "# Level of detail the dataset -> get existing with client.list('data-level')\n    # Example data levels: ['census', 'postal-code', 'municipalities', 'provinces', 'regiones', ...]",
-        "default": "Here the level",
-    },
-    "timestamp_column": {
-        "comment": "# Timestamp column of the dataset",
-        "default": None,
-    },
-    "start_data": {
-        "comment": "# Start date of the dataset (if it is a time series)",
-        "default": None,
-    },
-    "last_data": {
-        "comment": "# Last date of the dataset (if it is a time series)",
-        "default": None,
-    },
-    "n_time_slices": {
-        "comment": "# Number of time points of the dataset (if it is a time series)",
-        "default": 0,
-    },
-    "n_values": {
-        "comment": "# Number of values of the dataset (number of rows)",
-        "default": 0,
-    },
-    "n_variables": {
-        "comment": "# Number of variables of the dataset (number of columns with references to other datasets)",
-        "default": 0,
-    },
-    "n_features": {
-        "comment": "# Number of features of the dataset (number of columns with values)",
-        "default": 0,
-    },
-    "next_update": {
-        "comment": "# Next estimated update of the dataset",
-        "default": None,
-    },
-    "update_frequency": {
-        "comment": "# Update frequency of the dataset (e.g. 'monthly', 'annual', 'triennial', ...).",
-        "default": "custom",
-    },
-    "granularity": {
-        "comment": "# Time granularity of the dataset (if it is a time series one month between time points would be 'monthly', ...)",
-        "default": "custom",
-    },
-    "dataset_documentation": {
-        "comment": "# Code of a dataset documentation",
-        "default": None,
-    },
-    "related_datasets": {
-        "comment": "# List of related datasets (e.g. ['municipalities', 'provinces'])",
-        "default": [],
-    },
+    "name": FieldSpec(
+        comment="# Name of the dataset (English)",
+        default="Here the name in English",
+    ),
+    "name_es": FieldSpec(
+        comment="# Name of the dataset (Spanish)",
+        default="Nombre en Español",
+    ),
+    "description": FieldSpec(
+        comment="# Description of the dataset (English)",
+        default="Here the description in English",
+    ),
+    "description_es": FieldSpec(
+        comment="# Description of the dataset (Spanish)",
+        default="Descripción en Español",
+    ),
+    "license": FieldSpec(
+        comment="# License of the dataset (e.g. 'ine') -> get existing with client.list('license')",
+        default="",
+    ),
+    "publisher": FieldSpec(
+        comment="# Publisher of the dataset (e.g. 'ine') -> get existing with client.list('publisher')",
+        default="ine",
+    ),
+    "scope": FieldSpec(
+        comment="# Scope of the dataset -> get all scopes with client.list('scope')\n    # Example scopes: ['europe', 'spain', 'without-scope']",
+        default="spain",
+    ),
+    "order": FieldSpec(
+        comment="# Order of the dataset in the marketplace (lower is first)",
+        default=5,
+    ),
+    "is_public": FieldSpec(
+        comment="# Should be the dataset shown to non-admin users?",
+        default=True,
+    ),
+    "categories": FieldSpec(
+        comment="# list of categories of the dataset -> get existing with client.list('category')\n    # Example categories: ['employment', 'geospatial', 'population', 'socioeconomic']",
+        default=["socioeconomic", "population"],
+    ),
+    "level": FieldSpec(
+        comment="# Level of detail the dataset -> get existing with client.list('data-level')\n    # Example data levels: ['census', 'postal-code', 'municipalities', 'provinces', 'regiones', ...]",
+        default="Here the level",
+    ),
+    "timestamp_column": FieldSpec(
+        comment="# Timestamp column of the dataset",
+        default=None,
+    ),
+    "start_data": FieldSpec(
+        comment="# Start date of the dataset (if it is a time series)",
+        default=None,
+    ),
+    "last_data": FieldSpec(
+        comment="# Last date of the dataset (if it is a time series)",
+        default=None,
+    ),
+    "n_time_slices": FieldSpec(
+        comment="# Number of time points of the dataset (if it is a time series)",
+        default=0,
+    ),
+    "n_values": FieldSpec(
+        comment="# Number of values of the dataset (number of rows)",
+        default=0,
+    ),
+    "n_variables": FieldSpec(
+        comment="# Number of variables of the dataset (number of columns with references to other datasets)",
+        default=0,
+    ),
+    "n_features": FieldSpec(
+        comment="# Number of features of the dataset (number of columns with values)",
+        default=0,
+    ),
+    "next_update": FieldSpec(
+        comment="# Next estimated update of the dataset",
+        default=None,
+    ),
+    "update_frequency": FieldSpec(
+        comment="# Update frequency of the dataset (e.g. 'monthly', 'annual', 'triennial', ...).",
+        default="custom",
+    ),
+    "granularity": FieldSpec(
+        comment="# Time granularity of the dataset (if it is a time series one month between time points would be 'monthly', ...)",
+        default="custom",
+    ),
+    "dataset_documentation": FieldSpec(
+        comment="# Code of a dataset documentation",
+        default=None,
+    ),
+    "related_datasets": FieldSpec(
+        comment="# List of related datasets (e.g. ['municipalities', 'provinces'])",
+        default=[],
+    ),
 }
 
 
 feature_fields_mapping = {
-    "name": {
-        "comment": "# Name of the feature (English)",
-        "default": "Here the name of the feature in English",
-    },
-    "name_es": {
-        "comment": "# Name of the feature (Spanish)",
-        "default": "Nombre en Español",
-    },
-    "description": {
-        "comment": "# Description of the feature (English)",
-        "default": "Here the description of the feature in English",
-    },
-    "description_es": {
-        "comment": "# Description of the feature (Spanish)",
-        "default": "Descripción en Español",
-    },
-    "feature_type": {
-        "comment": '# Type of feature: "cat", "geo", "stat", "inter", "id", "number", "perc"',
-        "default": "cat",
-    },
-    "data_type": {
-        "comment": '# Data type of feature: "str", "int", "float", "text", "interval", "date". "datetime", "geo"',
-        "default": "str",
-    },
-    "license": {"comment": "# Code of the feature license", "default": "ine-license"},
-    "reference_feature": {
-        "comment": "# Does this column reference another feature? Code of the feature or None",
-        "default": None,
-    },
+    "name": FieldSpec(
+        comment="# Name of the feature (English)",
+        default="Here the name of the feature in English",
+    ),
+    "name_es": FieldSpec(
+        comment="# Name of the feature (Spanish)",
+        default="Nombre en Español",
+    ),
+    "description": FieldSpec(
+        comment="# Description of the feature (English)",
+        default="Here the description of the feature in English",
+    ),
+    "description_es": FieldSpec(
+        comment="# Description of the feature (Spanish)",
+        default="Descripción en Español",
+    ),
+    "feature_type": FieldSpec(
+        comment='# Type of feature: "cat", "geo", "stat", "inter", "id", "number", "perc"',
+        default="cat",
+    ),
+    "data_type": FieldSpec(
+        comment='# Data type of feature: "str", "int", "float", "text", "interval", "date". "datetime", "geo"',
+        default="str",
+    ),
+    "license": FieldSpec(comment="# Code of the feature license", default="ine-license"),
+    "reference_feature": FieldSpec(
+        comment="# Does this column reference another feature? Code of the feature or None",
+        default=None,
+    ),
 }
 
 
+def _fields_template(
+    mapping: Dict[str, FieldSpec], line_keys: Iterable[str] = ()
+) -> str:
+    """Precomputes the block of the snippet with the fields of the mapping as a
+    single template, with a '%(key)s' placeholder for the value of each field
+    (or for the whole line of the keys in `line_keys`)"""
+    lines = []
+    for key, field in mapping.items():
+        if key in line_keys:
+            lines.append(f"%({key})s")
+        else:
+            comment_escaped = field.comment.replace("%", "%%")
+            lines.append(f"    '{key}': %({key})s, {comment_escaped}\n")
+
+    return "".join(lines)
+
+
+def _format_value(value: Any) -> Any:
+    """Formats a value as it is written in the snippet (strings are quoted)"""
+    if isinstance(value, str):
+        return f"'{value.translate(_ESCAPE_TABLE)}'"
+
+    return value
+
+
+_DATASET_FIELD_DEFAULTS = tuple(
+    (key, field.default) for key, field in dataset_fileds_mapping.items()
+)
+_FEATURE_FIELD_DEFAULTS = tuple(
+    (key, field.default) for key, field in feature_fields_mapping.items()
+)
+_DATASET_FIELDS_TEMPLATE = _fields_template(
+    dataset_fileds_mapping, line_keys={"timestamp_column"}
+)
+_FEATURE_FIELDS_TEMPLATE = _fields_template(feature_fields_mapping)
+_TIMESTAMP_COLUMN_LINE = _fields_template(
+    {"timestamp_column": dataset_fileds_mapping["timestamp_column"]}
+)
+_NO_TIMESTAMP_COLUMN = "    # 'timestamp_column': None, # No timestamp column detected\n"
+
+
+def _prefetch(features: List["Feature"]) -> None:
+    """Fetches the previous values of the features concurrently (features not
+    found in the database keep their current metadata)"""
+    _map_concurrently(lambda feature: feature.fetch(fail_not_found=False), features)
+
+
 def helper_dataset(
     client: "Client",
     dataset: Union["Dataset", str],
-    df: Optional[Union[pd.DataFrame, gpd.GeoDataFrame]] = None,
+    df: Optional[Union["pd.DataFrame", "gpd.GeoDataFrame"]] = None,
     publisher: str = "ine",
     license: str = "ine-license",
 ) -> str:
@@ -192,19 +248,15 @@ def helper_dataset(
     else:
         metadata_from_pandas = ""
 
-    dataset_fields = ""
-    for key, comment in dataset_fileds_mapping.items():
-        value = dataset._metadata.get(key, comment["default"])
-        if key == "timestamp_column" and value is None:
-            dataset_fields += f"    # '{key}': None, # No timestamp column detected\n"
-            continue
-        if isinstance(value, str):
-            value = value.replace("\n", "\\n")
-            value = value.replace("'", "\\'")
-            value = value.replace('"', '\\"')
-            value = "'" + value + "'"
-
-        dataset_fields += f"    '{key}': {value}, {comment['comment']}\n"
+    values = {
+        key: _format_value(dataset._metadata.get(key, default))
+        for key, default in _DATASET_FIELD_DEFAULTS
+    }
+    if values["timestamp_column"] is None:
+        values["timestamp_column"] = _NO_TIMESTAMP_COLUMN
+    else:
+        values["timestamp_column"] = _TIMESTAMP_COLUMN_LINE % values
+    dataset_fields = _DATASET_FIELDS_TEMPLATE % values
 
     dataset_dictionary = "# Edit this block to update the dataset fields\n"
     dataset_dictionary += f"dataset.from_dict({{\n{dataset_fields}}})\n\n"
@@ -213,40 +265,40 @@ def helper_dataset(
     dataset_dictionary += "#                'annual', 'semiannual', '4monthly', 'quarterly', 'every2months',\n"
     dataset_dictionary += "#                'Monthly', 'twicemonthly', 'weekly', 'daily', 'dailybusiness', 'hourly', 'everyminute']\n\n"
 
+    feature_fields_parts = []
     if not exists and df is None:
-        feature_fields = "# PLEASE! -> provide a df to infer the columns and call again the code generator\n"
-        feature_fields += "# -> helper_dataset(client, dataset, df)\n\n"
+        feature_fields_parts.append(
+            "# PLEASE! -> provide a df to infer the columns and call again the code generator\n"
+            "# -> helper_dataset(client, dataset, df)\n\n"
+        )
     elif dataset.features:
-        feature_fields = "# Review and edit this block to update the feature fields\n\n"
-
-        for i, feature in enumerate(dataset.features):
-            if exists:
-                try:
-                    feature = feature.fetch()
-                except ObjectNotFound:
-                    pass
-            feature_str = f"#Feature {i}: {feature.code} (column {feature._metadata.get('column', '-')})\n"
-            feature_str += f"dataset.features[{i}].from_dict({{\n"
+        feature_fields_parts.append(
+            "# Review and edit this block to update the feature fields\n\n"
+        )
 
-            for key, comment in feature_fields_mapping.items():
-                value = feature._metadata.get(key, comment["default"])
+        if exists:
+            _prefetch(dataset.features)
 
-                if isinstance(value, str):
-                    value = value.replace("\n", "\\n")
-                    value = value.replace("'", "\\'")
-                    value = value.replace('"', '\\"')
-                    value = "'" + value + "'"
+        for i, feature in enumerate(dataset.features):
+            feature_fields_parts.append(
+                f"#Feature {i}: {feature.code} (column {feature._metadata.get('column', '-')})\n"
+                f"dataset.features[{i}].from_dict({{\n"
+            )
 
-                feature_str += f"    '{key}': {value}, {comment['comment']}\n"
+            values = {
+                key: _format_value(feature._metadata.get(key, default))
+                for key, default in _FEATURE_FIELD_DEFAULTS
+            }
+            feature_fields_parts.append(_FEATURE_FIELDS_TEMPLATE % values)
 
-            feature_str += "})\n\n"
-            feature_fields += feature_str
+            feature_fields_parts.append("})\n\n")
+    feature_fields = "".join(feature_fields_parts)
 
     save = "\n# Uncomment this to save the dataset and the features\n# dataset.save() # <- Uncomment this\n\n"
 
     if df is not None:
         upload_df = "# Upload the files\n"
-        if isinstance(df, gpd.GeoDataFrame):
+        if _is_geodataframe(df):
             upload_df += "# Uncomment this upload a GEOPANDAS dataframe (assuming is called gdf)\n"
             upload_df += "# dataset.upload_file(gdf, filetype='geoparquet') # If file exists and want to replace add update=True\n\n"
 
@@ -262,13 +314,14 @@ def helper_dataset(
     else:
         upload_df = ""
 
-    string = (
-        initial_comment
-        + get_dataset
-        + metadata_from_pandas
-        + dataset_dictionary
-        + feature_fields
-        + save
-        + upload_df
+    return "".join(
+        (
+            initial_comment,
+            get_dataset,
+            metadata_from_pandas,
+            dataset_dictionary,
+            feature_fields,
+            save,
+            upload_df,
+        )
     )
-    return string
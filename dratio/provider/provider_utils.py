@@ -24,11 +24,19 @@
 Functionalities to help with the creation of datasets
 """
 import json
-import re
 import warnings
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    infer_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+)
 
 try:
     import geopandas as gpd
@@ -79,19 +87,39 @@ def metadata_from_pandas(
 
     has_geom = isinstance(df, gpd.GeoDataFrame)
     has_timestamp = timestamp_column in df.columns
+    # Features already in the dataset are updated instead of created again
+    known_features = _features_by_code(dataset)
     if has_geom:
         geo_feature = geometry_column_feature(
-            dataset=dataset, gdf=df, order=len(df.columns), column_name="geometry"
+            dataset=dataset,
+            gdf=df,
+            order=len(df.columns),
+            column_name="geometry",
+            features=known_features,
         )
-        df = pd.DataFrame(df.drop(columns=["geometry"]))
+        # Plain dataframe (so the preview can take a string geometry column)
+        # sharing the data of the dropped frame
+        df = pd.DataFrame(df.drop(columns=["geometry"]), copy=False)
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
 
-        for order, column in enumerate(df.columns):
-            feature = column_feature(
-                dataset=dataset, column=df[column], column_name=column, order=order + 1
+        # Statistics of all the columns at once
+        n_not_null = df.count()
+        is_unique = df.nunique(dropna=False) == len(df)
+
+        features = [
+            column_feature(
+                dataset=dataset,
+                column=df[column],
+                column_name=column,
+                order=order + 1,
+                is_unique=bool(is_unique[column]),
+                n_not_null=int(n_not_null[column]),
+                features=known_features,
             )
-            dataset.add_feature(feature)
+            for order, column in enumerate(df.columns)
+        ]
+        dataset.add_features(features)
 
         preview = extract_table_preview(df)
 
@@ -99,12 +127,14 @@ def metadata_from_pandas(
             preview["geometry"] = "<geometry>"
             dataset.add_feature(geo_feature)
 
-    dataset["preview"] = json.loads(preview.to_json(orient="records"))
+    dataset["preview"] = table_preview_records(preview)
 
     if has_timestamp:
-        dataset["start_data"] = pd.to_datetime(df[timestamp_column].min()).isoformat()
-        dataset["last_data"] = pd.to_datetime(df[timestamp_column].max()).isoformat()
-        dataset["n_time_slices"] = int(df[timestamp_column].nunique())
+        # Parsed once (a no-op for datetime columns)
+        timestamps = pd.to_datetime(df[timestamp_column])
+        dataset["start_data"] = timestamps.min().isoformat()
+        dataset["last_data"] = timestamps.max().isoformat()
+        dataset["n_time_slices"] = int(timestamps.nunique())
 
     for feature in dataset.features:
         feature["publisher"] = publisher
@@ -127,12 +157,13 @@ def infer_granularity(timestamp_column: pd.Series) -> str:
         String with the granularity of the timestamp column.
 
     """
-    import numpy as np
+    timestamps = pd.to_datetime(timestamp_column).drop_duplicates().sort_values()
+    median = timestamps.diff().dropna().median()
 
-    median = np.median(np.diff(np.array(pd.to_datetime(timestamp_column).unique())))
-
-    seconds = np.timedelta64(median, "s").astype(int)
-    days = np.timedelta64(median, "D").astype(int)
+    # Thresholds are compared with whole seconds and days (e.g. sub-second
+    # noise or a few hours over a day do not change the granularity)
+    seconds = median // pd.Timedelta(seconds=1)
+    days = median // pd.Timedelta(days=1)
 
     if seconds < 500:
         s = "everyminute"  # Every minute
@@ -172,49 +203,68 @@ def infer_granularity(timestamp_column: pd.Series) -> str:
 
 def slugify(text: str) -> str:
     name = text.strip().lower().replace(" ", "-").replace("_", "-")
-    # Also substitutes multiple '-' into a single one
-    return re.sub(r"[-]+", "-", name)
+    # Also substitutes multiple '-' into a single one (each pass halves the
+    # longest run, column names rarely need more than one)
+    while "--" in name:
+        name = name.replace("--", "-")
+
+    return name
 
 
 def infer_data_type(column: "pd.Series") -> Union[str, None]:
-    name = str(column.dtype)
-    value_type = str(type(column.values[0]))
+    """Infers the data type of a column from its dtype ('int', 'float',
+    'datetime', 'date', 'interval' or 'str'), using the first value of object
+    and categorical columns."""
+    dtype = column.dtype
 
-    if "interval" in name:
+    # Checks on the dtype object (instead of substrings of its name)
+    if isinstance(dtype, pd.IntervalDtype):
         return "interval"
-    elif "int" in name:
+    elif is_integer_dtype(dtype):
         return "int"
-    elif "float" in name:
+    elif is_float_dtype(dtype):
         return "float"
-    elif "category" in name:
-        return value_type
-    elif "bool" in name:
+    elif isinstance(dtype, pd.CategoricalDtype):
+        return str(type(column.iloc[0]))
+    elif is_bool_dtype(dtype):
         return "str"
-    elif "date" in name:
+    elif is_datetime64_any_dtype(dtype):
         return "datetime"
-    elif "O" in name:
+    elif is_object_dtype(dtype):
+        value_type = str(type(column.iloc[0]))
         if "str" in value_type:
-            return str
+            return "str"
+        if "datetime.datetime" in value_type:
+            return "datetime"
         if "datetime.date" in value_type:
             return "date"
-        if "datetime" in value_type:
-            return "datetime"
 
     return "str"
 
 
-def infer_feature_type(column: "pd.Series") -> Union[str, None]:
+# Feature types that only depend on the data type of the column
+_FEATURE_TYPES = {
+    "interval": "interval",
+    "category": "cat",
+    "float": "number",
+    "str": "cat",
+}
+
+
+def infer_feature_type(
+    column: "pd.Series", is_unique: Optional[bool] = None
+) -> Union[str, None]:
     data_type = infer_data_type(column)
 
-    if data_type == "interval":
-        return "interval"
-    elif data_type == "category":
-        return "cat"
-    elif data_type == "float":
-        return "number"
-    elif data_type == "str":
-        return "cat"
-    elif column.is_unique:
+    feature_type = _FEATURE_TYPES.get(data_type)
+    if feature_type is not None:
+        return feature_type
+
+    # Checking uniqueness needs a full pass over the column
+    if is_unique is None:
+        is_unique = column.is_unique
+
+    if is_unique:
         return "id"
     elif data_type == "int":
         return "number"
@@ -222,35 +272,81 @@ def infer_feature_type(column: "pd.Series") -> Union[str, None]:
     return "cat"
 
 
+def _features_by_code(dataset: "Dataset") -> Dict[str, "Feature"]:
+    """Returns the features already in the dataset by code (none if the
+    dataset does not exist yet and no feature has been added)."""
+    if not dataset._fetched:
+        dataset.fetch(fail_not_found=False)
+
+    if dataset._exists:
+        features = dataset.features
+    else:
+        features = dataset._features or []
+
+    return {feature.code: feature for feature in features}
+
+
+def _get_feature(
+    dataset: "Dataset", code: str, features: Optional[Dict[str, "Feature"]] = None
+) -> "Feature":
+    """Returns the feature with the given code from `features`, creating it
+    (and adding it to `features`) if it is not there."""
+    if features is None:
+        return dataset._client.get_feature(code)
+
+    feature = features.get(code)
+    if feature is None:
+        feature = features[code] = dataset._client.get_feature(code)
+
+    return feature
+
+
 def column_feature(
     dataset: "Dataset",
     column: "pd.Series",
     column_name: str,
     order: int,
+    is_unique: Optional[bool] = None,
+    n_not_null: Optional[int] = None,
+    features: Optional[Dict[str, "Feature"]] = None,
 ) -> "Feature":
+    """Creates the feature of a column of a dataframe. The uniqueness and the
+    number of non-null values are computed from the column unless provided
+    (e.g. computed at once for all the columns of the dataframe). Features
+    found by code in `features` are reused."""
+    if is_unique is None:
+        is_unique = bool(column.is_unique)
+    if n_not_null is None:
+        # count() skips the nulls without building an intermediate boolean mask
+        n_not_null = int(column.count())
+
     subcode = slugify(column_name)
     code = f"{dataset.code}__{subcode}"
-    feature = dataset._client.get_feature(code)
+    feature = _get_feature(dataset, code, features)
     feature["name"] = subcode.replace("-", " ").replace("_", " ").capitalize()
     feature["dataset"] = dataset
     feature["column"] = column_name
     feature["data_type"] = infer_data_type(column)
-    feature["feature_type"] = infer_feature_type(column)
+    feature["feature_type"] = infer_feature_type(column, is_unique=is_unique)
 
-    feature["is_unique"] = bool(column.is_unique)
+    feature["is_unique"] = is_unique
     feature["n_values"] = len(column)
-    feature["n_not_null"] = int(column.notna().sum())
+    feature["n_not_null"] = n_not_null
     feature["order"] = order
 
     return feature
 
 
 def geometry_column_feature(
-    dataset: "Dataset", gdf: "gpd.GeoDataFrame", column_name: str, order: int
+    dataset: "Dataset",
+    gdf: "gpd.GeoDataFrame",
+    column_name: str,
+    order: int,
+    features: Optional[Dict[str, "Feature"]] = None,
 ) -> "Feature":
     subcode = slugify(column_name)
     code = f"{dataset.code}__{subcode}"
-    feature = dataset._client.get_feature(code)
+    feature = _get_feature(dataset, code, features)
 
     feature["name"] = subcode.replace("-", " ").replace("_", " ").capitalize()
     feature["dataset"] = dataset
@@ -264,7 +360,31 @@ def geometry_column_feature(
 
 
 def extract_table_preview(df: "pd.DataFrame", n_rows: int = 50) -> "pd.DataFrame":
-    preview = df.head(n_rows).copy().reset_index(drop=True)
+    # reset_index already returns a new frame (no need of an extra copy)
+    preview = df.head(n_rows).reset_index(drop=True)
     if "id" not in preview.columns:
-        preview = preview.rename_axis("id").reset_index()
+        preview.insert(0, "id", np.arange(len(preview), dtype=np.int64))
     return preview
+
+
+# Inferred types whose values are already JSON-native (once nulls are None)
+_JSON_NATIVE_TYPES = frozenset(
+    {"string", "integer", "floating", "mixed-integer-float", "boolean", "empty"}
+)
+
+
+def table_preview_records(preview: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """Converts a table preview into a list of JSON-serializable records.
+
+    Tables with only numbers, strings and booleans are converted directly
+    with `to_dict`. Other types (e.g. dates, timedeltas or intervals) are
+    serialized and parsed back with pandas' JSON encoder.
+    """
+    if all(
+        infer_dtype(preview[column], skipna=True) in _JSON_NATIVE_TYPES
+        for column in preview.columns
+    ):
+        preview = preview.astype(object).where(preview.notna(), None)
+        return preview.to_dict(orient="records")
+
+    return json.loads(preview.to_json(orient="records"))
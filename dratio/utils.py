@@ -23,34 +23,80 @@
 """
 Utilities for the dratio package.
 """
+import os
+import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 import requests
-from .exceptions import InvalidRequest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-try:  # Compatibility with Python 3.7
-    from typing import Literal
-except ImportError:
-    from typing_extensions import Literal
+from ._compat import Literal
+from .exceptions import InvalidRequest
 
 if TYPE_CHECKING:  # Pandas only as as type hint
     import pandas as pd
+    import pyarrow as pa
 
 
 __all__ = [
     "_format_list_response",
-    "_remove_and_copy",
     "_get_params_from_kwargs",
     "_warn_param_used",
     "get_version",
     "_raise_client_exception",
+    "_map_concurrently",
+    "_get_transfer_session",
+    "_concat_tables",
+    "_is_geodataframe",
 ]
 
+# Number of retries of a file transfer (upload or download) on transient
+# server errors
+TRANSFER_RETRIES = 5
+
+
+def _get_max_concurrent_requests(default: int = 8) -> int:
+    """Reads the maximum number of concurrent requests from the environment
+    variable DRATIO_MAX_CONCURRENT_REQUESTS (at least 1), warning about and
+    ignoring invalid values."""
+    value = os.environ.get("DRATIO_MAX_CONCURRENT_REQUESTS")
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        warnings.warn(
+            f"Invalid value of DRATIO_MAX_CONCURRENT_REQUESTS ({value!r}), "
+            f"using {default}."
+        )
+        return default
+
+
+# Maximum number of requests performed concurrently by the client (e.g. file
+# downloads), can be set with the environment variable
+# DRATIO_MAX_CONCURRENT_REQUESTS
+MAX_CONCURRENT_REQUESTS = _get_max_concurrent_requests()
+
+# Formats in which lists of objects can be returned
+LIST_FORMATS = frozenset({"pandas", "json", "api"})
+
 
 def _format_list_response(
     data: List[Dict[str, Any]],
     format: Literal["pandas", "json", "api"],
-    fields: Optional[List[str]] = None,
+    fields: Optional[Sequence[str]] = None,
     client: Optional[Any] = None,
     cls: Optional[Any] = None,
 ) -> Union["pd.DataFrame", List[Dict[str, Any]]]:
@@ -79,56 +125,58 @@ def _format_list_response(
     ValueError
         If `format` is not 'pandas' or 'json'.
     """
-    if cls is None and format == "api":
-        raise ValueError(f"format must be 'pandas', 'json', not {format}")
-
-    if format not in ["pandas", "json", "api"]:
+    if format not in LIST_FORMATS:
         raise ValueError(f"format must be 'pandas', 'json' or 'api', not {format}")
 
+    if format == "api" and cls is None:
+        raise ValueError(f"format must be 'pandas', 'json', not {format}")
+
     if format == "pandas":
         import pandas as pd
 
-        data = pd.json_normalize(data)
-        if len(data):
-            # Standardize column names
-            data.columns = data.columns.str.replace(".", "_", regex=False)
-
         if fields is not None:
-            for f in fields:
-                if f not in data.columns:
-                    data[f] = None
-
-            data = data[fields]
+            # The columns are known: the records are flattened as
+            # json_normalize does (nested keys joined with "_"), and only the
+            # requested columns are built
+            records = [_flatten_record(record) for record in data]
+            keys = set().union(*records)
+
+            data = pd.DataFrame.from_records(records, columns=fields)
+
+            # Fields missing in every record are filled with None at once
+            missing = [f for f in fields if f not in keys]
+            if missing:
+                data[missing] = None
+
+        else:
+            data = pd.json_normalize(data)
+            if len(data):
+                # Standardize column names (plain string replace per column,
+                # without building a string accessor on the index)
+                data.columns = [c.replace(".", "_") for c in data.columns]
 
     if format == "api":
-        data = [cls(client=client, code=d.get("code")) for d in data]
+        data = [cls._from_list_item(client, d) for d in data]
 
     return data
 
 
-def _remove_and_copy(dictionary: dict, key: str) -> Union[dict, None]:
-    """Removes a key from a dictionary and returns a copy of the dictionary
-    without the key.
+def _flatten_record(
+    record: Dict[str, Any], prefix: str = "", flat: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Flattens the nested objects of a record, joining their keys with "_"
+    (e.g. {"publisher": {"code": "ine"}} -> {"publisher_code": "ine"})."""
+    if flat is None:
+        flat = {}
 
-    Parameters
-    ----------
-    dictionary : dict
-        Dictionary from which to remove the key.
-    key : str
-        Key to remove from the dictionary.
+    for key, value in record.items():
+        key = prefix + key.replace(".", "_")
+        if isinstance(value, dict) and value:
+            _flatten_record(value, key + "_", flat)
+        else:
+            flat[key] = value
 
-    Returns
-    -------
-    dict
-        Copy of the dictionary without the key.
-    """
-    if dictionary is None:
-        return None
-
-    dictionary = dictionary.copy()
-    if key in dictionary:
-        del dictionary[key]
-    return dictionary
+    return flat
 
 
 def _get_params_from_kwargs(**kwargs) -> dict:
@@ -136,12 +184,7 @@ def _get_params_from_kwargs(**kwargs) -> dict:
 
     Filters those params that are not None and returns a dictionary with them.
     """
-    params = {}
-    for key, value in kwargs.items():
-        if value is not None:
-            params[key] = value
-
-    return params
+    return {key: value for key, value in kwargs.items() if value is not None}
 
 
 def _warn_param_used(param: Optional[Any], name: str):
@@ -173,3 +216,100 @@ def _raise_client_exception(response: "requests.Response"):
 
     # For non 4xx errors raise standard requests HTTPError
     response.raise_for_status()
+
+
+def _map_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> List[Any]:
+    """Applies `func` to each item using a pool of threads.
+
+    Intended for independent, latency-bound requests to the API (e.g. saving
+    several subresources), so that round trips overlap instead of being
+    performed one after another.
+
+    Parameters
+    ----------
+    func : Callable[[Any], Any]
+        Function to apply to each item.
+    items : Iterable[Any]
+        Items to process.
+    max_workers : int, optional
+        Maximum number of threads. Defaults to `MAX_CONCURRENT_REQUESTS`.
+
+    Returns
+    -------
+    List[Any]
+        Results of `func` in the same order as `items`.
+
+    Raises
+    ------
+    Exception
+        The first exception raised by `func`, if any.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def _concat_tables(tables: List["pa.Table"]) -> "pa.Table":
+    """Concatenates arrow tables without copying their data, unifying their
+    schemas if they differ (e.g. a column missing or null in some file)."""
+    import pyarrow as pa
+
+    try:
+        return pa.concat_tables(tables, promote_options="default")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def _is_geodataframe(obj: object) -> bool:
+    """Checks if an object is a GeoDataFrame without importing geopandas.
+
+    If geopandas has not been imported yet, no GeoDataFrame can exist.
+    """
+    gpd = sys.modules.get("geopandas")
+    return gpd is not None and isinstance(obj, gpd.GeoDataFrame)
+
+
+def _create_transfer_session() -> requests.Session:
+    """Creates the session used to transfer files from and to the presigned
+    urls issued by the API, with connection pooling and retries with
+    exponential backoff on transient server errors.
+
+    The session does not carry the credentials of the client: presigned urls
+    point to the storage service, not to the API.
+    """
+    retries = Retry(
+        total=TRANSFER_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=MAX_CONCURRENT_REQUESTS,
+        pool_maxsize=4 * MAX_CONCURRENT_REQUESTS,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+_TRANSFER_SESSION = None
+
+
+def _get_transfer_session() -> requests.Session:
+    """Returns the session shared by all the file transfers (keep-alive
+    connections), creating it on first use."""
+    global _TRANSFER_SESSION
+    if _TRANSFER_SESSION is None:
+        _TRANSFER_SESSION = _create_transfer_session()
+
+    return _TRANSFER_SESSION
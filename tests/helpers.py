@@ -0,0 +1,45 @@
+"""
+Helpers shared by the test suites
+"""
+import copy
+from unittest import mock
+
+KEY = "a" * 64
+
+
+def mock_response(status_code=200, data=None):
+    """Mocked response of the API"""
+    response = mock.Mock(status_code=status_code)
+    response.json.return_value = data
+    return response
+
+
+def mock_client(objects=None, **kwargs):
+    """Client whose requests are served from a dictionary of responses by
+    relative url (e.g. {"dataset/a/": {...}, "dataset/": [...]}), which is
+    updated by PATCH and DELETE requests. GET requests are recorded in
+    `client.requests`."""
+    from dratio import Client
+
+    objects = {} if objects is None else objects
+    client = Client(KEY, **kwargs)
+    client.requests = []
+
+    def perform_request(url, allowed_status=[], method="GET", **kw):
+        # The urls of the classes end with a slash (e.g. "dataset//a/")
+        url = url.replace("//", "/")
+        if method == "PATCH":
+            objects[url] = dict(kw["json"])
+        elif method == "DELETE":
+            del objects[url]
+            return mock_response(204)
+        else:
+            client.requests.append(url)
+
+        if url not in objects:
+            return mock_response(404, {"detail": "Not found."})
+        return mock_response(200, copy.deepcopy(objects[url]))
+
+    client._perform_request = perform_request
+
+    return client
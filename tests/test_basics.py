@@ -18,6 +18,18 @@ class PackageTest(unittest.TestCase):
         """
         from dratio import __version__
         self.assertRegex(__version__, r'^\d+\.\d+\.\d+$')
+
+    def test_lazy_pandas_import(self):
+        """
+        Importing the package and the dataset helpers does not import pandas
+        """
+        import subprocess
+        import sys
+        code = (
+            "import sys, dratio, dratio.provider.helper_dataset;"
+            "assert 'pandas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
         
 if __name__ == "__main__":
      unittest.main()
\ No newline at end of file
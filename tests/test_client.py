@@ -0,0 +1,242 @@
+import gc
+import tempfile
+import time
+import unittest
+
+from helpers import mock_client as _client
+
+
+class ObjectCacheTest(unittest.TestCase):
+    """
+    Test suite of the objects returned by Client.get
+    """
+    def test_disabled_by_default(self):
+        """
+        Each call returns a new object, so edits are not shared
+        """
+        client = _client({"dataset/a/": {"code": "a", "name": "A"}})
+        dataset = client.get_dataset("a")
+        dataset["name"] = "Edited"
+
+        other = client.get_dataset("a")
+        self.assertIsNot(dataset, other)
+        self.assertEqual(other["name"], "A")
+
+    def test_shared_objects(self):
+        """
+        With an object cache, the same object is returned by kind and code
+        """
+        client = _client(object_cache_size=2)
+        dataset = client.get_dataset("a")
+
+        self.assertIs(client.get("a"), dataset)
+        self.assertIsNot(client.get("a", kind="publisher"), dataset)
+
+    def test_eviction(self):
+        """
+        Least recently used objects are evicted, but are still returned while
+        referenced elsewhere
+        """
+        client = _client(object_cache_size=2)
+        a = client.get("a", kind="publisher")
+        b = client.get("b", kind="publisher")
+        client.get("c", kind="publisher")
+
+        self.assertNotIn(("publisher", "a"), client._object_cache)
+        self.assertIs(client.get("a", kind="publisher"), a)
+
+        # b is now the least recently used object and is not referenced
+        client.get("d", kind="publisher")
+        del b
+        gc.collect()
+        self.assertNotIn(("publisher", "b"), client._object_refs)
+
+    def test_invalidate(self):
+        """
+        Invalidated objects are created again
+        """
+        client = _client(object_cache_size=8)
+        a = client.get("a")
+        b = client.get("b")
+
+        client.invalidate("a")
+        self.assertIsNot(client.get("a"), a)
+        self.assertIs(client.get("b"), b)
+
+        client.clear_cache()
+        self.assertIsNot(client.get("b"), b)
+
+    def test_related_objects(self):
+        """
+        Related objects are kept by each object without an object cache
+        """
+        client = _client(
+            {
+                "file/f/": {"code": "f", "version": "v"},
+                "version/v/": {"code": "v", "dataset": {"code": "d"}},
+            }
+        )
+        file = client.get_file("f")
+        version = file.version
+        self.assertIs(file.version, version)
+        self.assertIs(version.dataset, version.dataset)
+        self.assertEqual(client.requests, ["file/f/", "version/v/"])
+
+
+class FetchCacheTest(unittest.TestCase):
+    """
+    Test suite of the metadata cached by the client after fetching objects
+    """
+    def setUp(self):
+        self.objects = {
+            f"publisher/{code}/": {"code": code, "name": code.upper()}
+            for code in "abc"
+        }
+        self.client = _client(self.objects, fetch_cache_size=2)
+
+    def fetch(self, code):
+        """Fetches a new object with the given code"""
+        from dratio.models import Publisher
+        return Publisher(code=code, client=self.client).fetch()
+
+    def test_disabled_by_default(self):
+        """
+        Without a fetch cache, each object performs its own request
+        """
+        client = _client(self.objects)
+        client.get("a", kind="publisher").fetch()
+        client.get("a", kind="publisher").fetch()
+        self.assertEqual(client.requests, ["publisher/a/", "publisher/a/"])
+
+    def test_eviction_order(self):
+        """
+        The least recently used metadata is discarded first
+        """
+        self.fetch("a")
+        self.fetch("b")
+        self.fetch("a")  # From the cache, a is now the most recently used
+        self.fetch("c")  # b is discarded
+        self.assertEqual(
+            self.client.requests, ["publisher/a/", "publisher/b/", "publisher/c/"]
+        )
+
+        self.fetch("a")
+        self.fetch("b")
+        self.assertEqual(self.client.requests[3:], ["publisher/b/"])
+
+    def test_cached_copies(self):
+        """
+        Edits of a fetched object do not change the cached metadata
+        """
+        self.fetch("a")["name"] = "Edited"
+        self.assertEqual(self.fetch("a")["name"], "A")
+
+    def test_save_invalidates(self):
+        """
+        Saved objects are requested again
+        """
+        publisher = self.fetch("a")
+        publisher["name"] = "Saved"
+        publisher.save()
+
+        self.assertEqual(self.fetch("a")["name"], "Saved")
+
+    def test_delete_invalidates(self):
+        """
+        Deleted objects are requested again
+        """
+        from dratio.exceptions import ObjectNotFound
+        self.fetch("a").delete()
+
+        with self.assertRaises(ObjectNotFound):
+            self.fetch("a")
+
+    def test_invalidate(self):
+        """
+        Invalidated metadata is requested again
+        """
+        self.fetch("a")
+        self.fetch("b")
+        self.client.invalidate("a")
+        self.fetch("a")
+        self.fetch("b")
+        self.assertEqual(self.client.requests[2:], ["publisher/a/"])
+
+        self.client.clear_cache()
+        self.fetch("b")
+        self.assertEqual(self.client.requests[3:], ["publisher/b/"])
+
+
+class PersistentCacheTest(unittest.TestCase):
+    """
+    Test suite of the persistent cache of reference objects
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.objects = {
+            "category/x/": {"code": "x", "name": "X"},
+            "scope/x/": {"code": "x", "name": "Scope X"},
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _client(self):
+        return _client(self.objects, persistent_cache=self.directory.name)
+
+    def _wait_revalidation(self, client):
+        deadline = time.time() + 5
+        while client._revalidating and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(client._revalidating)
+
+    def _make_stale(self, client):
+        client._persistent_cache.ttl = -1
+
+    def test_reused_across_clients(self):
+        """
+        Fresh entries are reused by other clients without requests
+        """
+        self._client().get("x", kind="category").fetch()
+        self._client().get("x", kind="scope").fetch()
+
+        client = self._client()
+        self.assertEqual(client.get("x", kind="category")["name"], "X")
+        self.assertEqual(client.requests, [])
+
+    def test_stale_while_revalidate(self):
+        """
+        Stale entries are returned while requested again in the background
+        """
+        self._client().get("x", kind="category").fetch()
+        self.objects["category/x/"] = {"code": "x", "name": "New X"}
+
+        client = self._client()
+        self._make_stale(client)
+        self.assertEqual(client.get("x", kind="category")["name"], "X")
+
+        self._wait_revalidation(client)
+        self.assertEqual(client.requests, ["category/x/"])
+        metadata, _ = client._persistent_cache.get("category/", "x")
+        self.assertEqual(metadata["name"], "New X")
+
+    def test_not_found_evicted(self):
+        """
+        Entries of objects not found are removed, without removing other kinds
+        with the same code
+        """
+        self._client().get("x", kind="category").fetch()
+        self._client().get("x", kind="scope").fetch()
+        del self.objects["category/x/"]
+
+        client = self._client()
+        self._make_stale(client)
+        client.get("x", kind="category").fetch()
+        self._wait_revalidation(client)
+
+        self.assertIsNone(client._persistent_cache.get("category/", "x"))
+        self.assertIsNotNone(client._persistent_cache.get("scope/", "x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from unittest import mock
+
+
+class SerializeTest(unittest.TestCase):
+    """
+    Test suite of the serialization of dataframes to upload
+    """
+    def test_arrow_stream_without_index(self):
+        """
+        Arrow streams only include the columns of the dataframe
+        """
+        import pandas as pd
+        import pyarrow as pa
+        from dratio.provider.file_upload import _serialize_dataframe
+
+        df = pd.DataFrame({"a": [1, 2, 3]}, index=[10, 20, 30])
+        with _serialize_dataframe(df, "arrow") as f:
+            table = pa.ipc.open_stream(f).read_all()
+
+        self.assertEqual(table.column_names, ["a"])
+        self.assertEqual(table.column("a").to_pylist(), [1, 2, 3])
+
+
+class PutFileTest(unittest.TestCase):
+    """
+    Test suite of the upload of files to presigned urls
+    """
+    def put(self, url, data=None, headers=None):
+        """Mocked PUT of the transfer session, which reads the body twice
+        rewinding it as urllib3 does when retrying a request"""
+        from urllib3.util.request import rewind_body, set_file_position
+
+        position = set_file_position(data, None)
+        self.bodies.append(data.read())
+        rewind_body(data, position)
+        self.bodies.append(data.read())
+        self.headers = headers
+
+        return mock.Mock(status_code=200)
+
+    def upload(self, file, filetype):
+        from dratio.provider.file_upload import _upload_file
+
+        self.bodies = []
+        session = mock.Mock()
+        session.put.side_effect = self.put
+        with mock.patch(
+            "dratio.provider.file_upload._get_transfer_session", return_value=session
+        ):
+            _upload_file(file, filetype=filetype, url="https://storage/file")
+
+        session.put.assert_called_once()
+
+    def test_dataframe(self):
+        """
+        Serialized dataframes are sent with their size
+        """
+        import pandas as pd
+        from dratio.provider.file_upload import _serialize_dataframe
+
+        df = pd.DataFrame({"a": range(1000), "b": ["x"] * 1000})
+        with _serialize_dataframe(df, "csv") as f:
+            expected = f.read()
+
+        self.upload(df, "csv")
+        self.assertEqual(self.bodies, [expected, expected])
+        self.assertEqual(self.headers["Content-Length"], str(len(expected)))
+
+    def test_path(self):
+        """
+        Files are sent with their size
+        """
+        import os
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.csv")
+            with open(path, "wb") as f:
+                f.write(b"a,b\n1,2\n")
+
+            self.upload(path, "csv")
+
+        self.assertEqual(self.bodies, [b"a,b\n1,2\n"] * 2)
+        self.assertEqual(self.headers["Content-Length"], "8")
+
+
+if __name__ == "__main__":
+    unittest.main()
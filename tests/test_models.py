@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+from helpers import mock_client
+
+ITEMS = [
+    {"code": "a", "name": "A", "url": "https://a.org", "scope": {"code": "es"}},
+    {"code": "b", "name": "B", "url": "https://b.org", "scope": {"code": "es"}},
+    {"code": "c", "name": "C", "url": "https://c.org", "scope": {"code": "fr"}},
+]
+
+
+class ApiListTest(unittest.TestCase):
+    """
+    Test suite of the lists of objects returned with format="api"
+    """
+    def setUp(self):
+        from dratio.models import Publisher
+        self.client = mock_client(
+            {
+                "publisher/": ITEMS,
+                "publisher/a/": {"code": "a", "name": "A", "scope": "es"},
+            }
+        )
+        self.publishers = Publisher._list(self.client, format="api")
+
+    def test_plain_list(self):
+        """
+        Objects are returned in a plain list, without fetching them
+        """
+        from dratio.models import Publisher
+        self.assertIsInstance(self.publishers, list)
+        self.assertEqual([p.code for p in self.publishers], ["a", "b", "c"])
+        self.assertTrue(all(isinstance(p, Publisher) for p in self.publishers))
+        self.assertEqual(self.client.requests, ["publisher/"])
+
+        self.publishers.append(self.publishers[0])
+        self.assertEqual(len(self.publishers + []), 4)
+
+    def test_preloaded_fields(self):
+        """
+        Scalar fields of the list are read without fetching the object
+        """
+        publisher = self.publishers[0]
+        self.assertEqual(publisher["name"], "A")
+        self.assertEqual(publisher.url, "https://a.org")
+        self.assertEqual(self.client.requests, ["publisher/"])
+
+    def test_nested_field_fetches(self):
+        """
+        Nested fields are not preloaded, so reading them fetches the object
+        """
+        publisher = self.publishers[0]
+        self.assertEqual(publisher["scope"], "es")
+        self.assertEqual(self.client.requests, ["publisher/", "publisher/a/"])
+
+        # Fetched objects are not fetched again
+        publisher["name"]
+        self.assertEqual(self.client.requests, ["publisher/", "publisher/a/"])
+
+
+class FileDownloadTest(unittest.TestCase):
+    """
+    Test suite of the download of the content of files
+    """
+    def download(self, chunks, size):
+        from dratio.models import File
+        response = mock.Mock(status_code=200, headers={"Content-Length": str(size)})
+        response.iter_content.return_value = chunks
+        session = mock.Mock()
+        session.get.return_value = response
+
+        file = File(code="f", client=mock_client())
+        with mock.patch(
+            "dratio.models.dataset_file._get_transfer_session", return_value=session
+        ), mock.patch.object(File, "_get_cached_download_url", return_value="url"):
+            return file._download()
+
+    def test_download(self):
+        """
+        Chunks are joined in a buffer of the size of the response
+        """
+        self.assertEqual(self.download([b"abc", b"de"], 5).read(), b"abcde")
+
+    def test_incomplete_download(self):
+        """
+        Responses shorter than their Content-Length raise an error
+        """
+        from requests.exceptions import ChunkedEncodingError
+        with self.assertRaisesRegex(ChunkedEncodingError, "Incomplete"):
+            self.download([b"abc"], 5)
+
+    def test_oversized_download(self):
+        """
+        Responses longer than their Content-Length raise an error
+        """
+        from requests.exceptions import ChunkedEncodingError
+        with self.assertRaisesRegex(ChunkedEncodingError, "more than the 5 bytes"):
+            self.download([b"abc", b"def"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import datetime
+import unittest
+
+import pandas as pd
+
+from helpers import mock_client
+
+
+class InferDataTypeTest(unittest.TestCase):
+    """
+    Test suite of the data types inferred from the columns of a dataframe
+    """
+    def assertDataType(self, values, expected, dtype=None):
+        from dratio.provider.provider_utils import infer_data_type
+        column = pd.Series(values, dtype=dtype)
+        self.assertEqual(infer_data_type(column), expected, str(column.dtype))
+
+    def test_numbers(self):
+        self.assertDataType([1, 2], "int")
+        self.assertDataType([1, None], "int", dtype="Int64")
+        self.assertDataType([1.5, 2], "float")
+        self.assertDataType([1.5, None], "float", dtype="Float64")
+
+    def test_interval(self):
+        self.assertDataType(pd.interval_range(0, 2), "interval")
+
+    def test_categorical(self):
+        self.assertDataType(["a", "b"], str(str), dtype="category")
+
+    def test_bool(self):
+        self.assertDataType([True, False], "str")
+
+    def test_datetime64(self):
+        self.assertDataType(pd.to_datetime(["2022-01-01", "2022-01-02"]), "datetime")
+        self.assertDataType(
+            pd.to_datetime(["2022-01-01"]).tz_localize("UTC"), "datetime"
+        )
+
+    def test_object(self):
+        self.assertDataType(["a", "b"], "str", dtype=object)
+        self.assertDataType([{"a": 1}], "str", dtype=object)
+        self.assertDataType(
+            [datetime.datetime(2022, 1, 1), None], "datetime", dtype=object
+        )
+        self.assertDataType([datetime.date(2022, 1, 1)], "date", dtype=object)
+
+
+class InferGranularityTest(unittest.TestCase):
+    """
+    Test suite of the granularity inferred from a timestamp column
+    """
+    def assertGranularity(self, freq, expected, periods=6, noise=None):
+        from dratio.provider.provider_utils import infer_granularity
+        timestamps = pd.Series(pd.date_range("2022-01-01", periods=periods, freq=freq))
+        if noise is not None:
+            timestamps += [pd.Timedelta(noise) * (i % 2) for i in range(periods)]
+        self.assertEqual(infer_granularity(timestamps), expected, freq)
+
+    def test_granularities(self):
+        self.assertGranularity("min", "everyminute")
+        self.assertGranularity("h", "hourly")
+        self.assertGranularity("D", "daily")
+        self.assertGranularity("W", "weekly")
+        self.assertGranularity("MS", "Monthly")
+        self.assertGranularity("QS", "quarterly")
+        self.assertGranularity("YS", "annual")
+
+    def test_whole_days(self):
+        """
+        Days are compared as whole days
+        """
+        self.assertGranularity("36h", "daily")
+        self.assertGranularity("60h", "dailybusiness")
+        self.assertGranularity("D", "daily", noise="900ms")
+
+    def test_unsorted(self):
+        """
+        Timestamps are sorted and repeated timestamps ignored
+        """
+        from dratio.provider.provider_utils import infer_granularity
+        timestamps = pd.Series(
+            pd.to_datetime(["2022-03-01", "2022-01-01", "2022-02-01", "2022-01-01"])
+        )
+        self.assertEqual(infer_granularity(timestamps), "Monthly")
+
+
+class ColumnFeatureTest(unittest.TestCase):
+    """
+    Test suite of the features created from the columns of a dataframe
+    """
+    def test_features_reused(self):
+        """
+        Features already in the dataset, or already created, are reused
+        """
+        from dratio.provider.provider_utils import _features_by_code, column_feature
+        client = mock_client(
+            {
+                "dataset/d/": {"code": "d", "feature_set": ["d__a"]},
+                "feature/d__a/": {"code": "d__a", "column": "a"},
+            }
+        )
+        dataset = client.get_dataset("d")
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+        features = _features_by_code(dataset)
+        a = column_feature(dataset, df["a"], "a", order=1, features=features)
+        b = column_feature(dataset, df["b"], "b", order=2, features=features)
+
+        self.assertIs(a, dataset.features[0])
+        self.assertEqual(a["order"], 1)
+        self.assertIs(
+            column_feature(dataset, df["b"], "b", order=2, features=features), b
+        )
+        self.assertEqual(client.requests.count("feature/d__b/"), 1)
+
+
+class TablePreviewTest(unittest.TestCase):
+    """
+    Test suite of the preview of the datasets
+    """
+    def test_id_column(self):
+        """
+        An id column numbering the first rows is added, regardless of the index
+        """
+        from dratio.provider.provider_utils import extract_table_preview
+        df = pd.DataFrame({"a": [3, 4, 5], "b": ["x", "y", "z"]}, index=[7, 8, 9])
+        preview = extract_table_preview(df, n_rows=2)
+
+        self.assertEqual(list(preview.columns), ["id", "a", "b"])
+        self.assertEqual(preview["id"].dtype, "int64")
+        self.assertEqual(list(preview.index), [0, 1])
+        self.assertEqual(
+            preview.to_dict(orient="records"),
+            [{"id": 0, "a": 3, "b": "x"}, {"id": 1, "a": 4, "b": "y"}],
+        )
+
+    def test_existing_id_column(self):
+        """
+        An existing id column is kept
+        """
+        from dratio.provider.provider_utils import extract_table_preview
+        df = pd.DataFrame({"a": [1, 2], "id": [10, 11]}, index=[5, 6])
+        preview = extract_table_preview(df)
+
+        self.assertEqual(list(preview.index), [0, 1])
+        self.assertEqual(
+            preview.to_dict(orient="records"),
+            [{"a": 1, "id": 10}, {"a": 2, "id": 11}],
+        )
+
+    def test_records(self):
+        """
+        Records of the preview are JSON-serializable, with nulls as None
+        """
+        from dratio.provider.provider_utils import (
+            extract_table_preview,
+            table_preview_records,
+        )
+        df = pd.DataFrame({"a": [1.5, None], "b": ["x", None]})
+        records = table_preview_records(extract_table_preview(df))
+
+        self.assertEqual(
+            records,
+            [{"id": 0, "a": 1.5, "b": "x"}, {"id": 1, "a": None, "b": None}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
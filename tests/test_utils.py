@@ -0,0 +1,66 @@
+import os
+import unittest
+from unittest import mock
+
+
+class UtilsTest(unittest.TestCase):
+    """
+    Test suite of the utilities of the package
+    """
+    def test_get_params_from_kwargs(self):
+        """
+        None values are not sent as params
+        """
+        from dratio.utils import _get_params_from_kwargs
+        params = _get_params_from_kwargs(dataset="a", version=None)
+        self.assertEqual(params, {"dataset": "a"})
+
+    def test_format_list_json(self):
+        """
+        Lists in json format are returned unchanged
+        """
+        from dratio.utils import _format_list_response
+        data = [{"code": "a", "publisher": {"code": "p"}}]
+        self.assertEqual(_format_list_response(data, format="json"), data)
+
+    def test_format_list_pandas(self):
+        """
+        Nested fields are flattened and missing fields are filled with None
+        """
+        from dratio.utils import _format_list_response
+        data = [{"code": "a", "publisher": {"code": "p"}}, {"code": "b"}]
+        df = _format_list_response(
+            data, format="pandas", fields=("code", "publisher_code", "name")
+        )
+        self.assertEqual(list(df.columns), ["code", "publisher_code", "name"])
+        self.assertEqual(df["code"].tolist(), ["a", "b"])
+        self.assertEqual(df["publisher_code"].tolist()[0], "p")
+        self.assertEqual(df["name"].tolist(), [None, None])
+
+    def test_format_list_invalid(self):
+        """
+        Invalid formats raise a ValueError
+        """
+        from dratio.utils import _format_list_response
+        with self.assertRaises(ValueError):
+            _format_list_response([], format="csv")
+        with self.assertRaises(ValueError):
+            _format_list_response([], format="api")
+
+    def test_max_concurrent_requests(self):
+        """
+        Invalid values of the environment variable are not used
+        """
+        from dratio.utils import _get_max_concurrent_requests
+        variable = "DRATIO_MAX_CONCURRENT_REQUESTS"
+        with mock.patch.dict(os.environ, {variable: "4"}):
+            self.assertEqual(_get_max_concurrent_requests(), 4)
+        with mock.patch.dict(os.environ, {variable: "0"}):
+            self.assertEqual(_get_max_concurrent_requests(), 1)
+        with mock.patch.dict(os.environ, {variable: "many"}):
+            with self.assertWarns(UserWarning):
+                self.assertEqual(_get_max_concurrent_requests(), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()